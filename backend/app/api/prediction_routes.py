@@ -1,8 +1,22 @@
 # Prediction routes
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, constr
+import asyncio
+import json
+from typing import Literal, Optional, Union
 
-from ..ml.inference.predict import predict_stock
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, conlist, constr
+from sqlalchemy.orm import Session
+
+from .. import database
+from ..ml.data_pipeline.price_store import data_version
+from ..ml.inference.batch_predict import CHUNK_SIZE, all_symbols, chunks, predict_chunk
+from ..ml.inference.executor import ExecutorSaturated, prediction_executor
+from ..ml.inference.predict import DATA_PATH, lstm_batcher, predict_stock_async
+from ..ml.inference.result_cache import result_cache
+from ..ml.inference.screener import DECISIONS, SORT_KEYS, screener
+from ..ml.inference.single_flight import prediction_flight
+from ..services.prediction_service import encode_cursor, get_history, prediction_buffer
 
 router = APIRouter(prefix="/predictions", tags=["predictions"])
 
@@ -12,6 +26,14 @@ class PredictionRequest(BaseModel):
     symbol: constr(strip_whitespace=True, min_length=1)
 
 
+class BatchPredictionRequest(BaseModel):
+    # a watchlist, or "all" for every symbol with price data
+    symbols: Union[
+        Literal["all"],
+        conlist(constr(strip_whitespace=True, min_length=1), min_length=1, max_length=500),
+    ]
+
+
 class PredictionResponse(BaseModel):
     symbol: str
     decision: str
@@ -19,9 +41,44 @@ class PredictionResponse(BaseModel):
     technical_score: float
     lstm_probability: float
     latest_price: float
+    date: Optional[str] = None  # date of the bar the prediction was made from
     explanation: list
 
 
+async def _run_prediction(fn, *args):
+    """Run ``fn(*args)`` in the prediction executor, mapping failures to HTTP errors"""
+    return await _guard(prediction_executor.run(fn, *args))
+
+
+async def _predict(symbol):
+    """``predict_stock_async`` on the prediction executor, with HTTP error mapping"""
+    return await _guard(predict_stock_async(symbol, prediction_executor.run,
+                                            timeout=prediction_executor.timeout))
+
+
+async def _guard(awaitable):
+    """Await prediction work, mapping failures to HTTP errors"""
+    try:
+        return await awaitable
+    except ExecutorSaturated:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="prediction capacity exhausted, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail="prediction timed out",
+        )
+    except Exception as exc:  # pragma: no cover - bubble up unexpected errors
+        # log.exception(exc)  # add logging if desired
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"prediction engine error: {exc}",
+        )
+
+
 @router.post("/predict", response_model=PredictionResponse)
 async def predict(req: PredictionRequest):
     """Get trading prediction for a stock.
@@ -34,25 +91,138 @@ async def predict(req: PredictionRequest):
     * scores using indicators and an LSTM
     * returns a decision, confidence score and explanation list
 
-    Proper HTTP errors are raised for missing data or unexpected failures.
+    Feature and scoring work runs in the bounded prediction executor so
+    the event loop stays free, and the LSTM probability comes from the
+    micro-batcher without holding an executor worker; a saturated executor
+    answers 503 and a slow prediction 504.
+    Concurrent requests for the same symbol and data version share one
+    computation.  Served predictions are recorded in the history through
+    the write-behind buffer.  Proper HTTP errors are raised for missing
+    data or unexpected failures.
     """
-    try:
-        result = predict_stock(req.symbol)
-    except Exception as exc:  # pragma: no cover - bubble up unexpected errors
-        # log.exception(exc)  # add logging if desired
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"prediction engine error: {exc}",
-        )
+    key = (req.symbol, data_version(req.symbol.replace(".NS", ""), DATA_PATH))
+    result = await prediction_flight.run(key, lambda: _predict(req.symbol))
 
     if result is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Stock data not found")
 
+    prediction_buffer.add(result)
     return result
 
 
+@router.post("/batch")
+async def predict_many(req: BatchPredictionRequest):
+    """Predict a watchlist (or the whole universe) in one request.
+
+    Symbols are loaded, featurized and scored in chunks, with one batched
+    LSTM pass per chunk.  Results stream back as NDJSON, one JSON object
+    per line in request order, so the first lines arrive before the whole
+    batch is done.  Symbols without data yield ``{"symbol", "error"}``.
+
+    Each chunk runs in the prediction executor like any other prediction.
+    The first chunk is computed before the response starts, so a saturated
+    executor still answers 503; a later chunk that fails yields an error
+    line for each of its symbols.
+    """
+    symbols = req.symbols
+    if symbols == "all":
+        symbols = await asyncio.to_thread(all_symbols, DATA_PATH)
+
+    pending = chunks(symbols, CHUNK_SIZE)
+    first = await _run_prediction(predict_chunk, pending[0]) if pending else []
+
+    async def lines():
+        for i, chunk in enumerate(pending):
+            try:
+                results = first if i == 0 else await prediction_executor.run(predict_chunk, chunk)
+            except ExecutorSaturated:
+                results = [{"symbol": symbol, "error": "prediction capacity exhausted, retry shortly"}
+                           for symbol in chunk]
+            except asyncio.TimeoutError:
+                results = [{"symbol": symbol, "error": "prediction timed out"} for symbol in chunk]
+            except Exception as exc:
+                results = [{"symbol": symbol, "error": f"prediction engine error: {exc}"}
+                           for symbol in chunk]
+
+            for result in results:
+                if "error" not in result:
+                    prediction_buffer.add(result)
+                yield json.dumps(result) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/screener")
+async def get_screener(
+    top: int = Query(20, ge=1, le=500),
+    decision: Optional[Literal[DECISIONS]] = None,
+    sort: Literal[SORT_KEYS] = "score",
+    order: Literal["desc", "asc"] = "desc",
+):
+    """Ranked universe from the in-memory screener snapshot.
+
+    The snapshot is re-scored in the background when new bars land, so a
+    request only slices pre-sorted results.  The first request after
+    startup builds it if the background refresh has not yet.
+    """
+    snapshot = screener.snapshot
+    if snapshot is None:
+        # in a thread, never the executor: the screener's snapshot lives in
+        # this process and a process pool could not pickle the bound method
+        snapshot = await asyncio.to_thread(screener.get)
+
+    results = snapshot.query(top, decision, sort, ascending=order == "asc")
+
+    return {
+        "as_of": snapshot.as_of,
+        "total": len(snapshot.views[(sort, decision)]),
+        "results": results,
+    }
+
+
+@router.get("/metrics")
+async def get_prediction_metrics():
+    """Prediction executor load, coalescing, caching, batching and history writes"""
+    return {
+        "executor": prediction_executor.stats(),
+        "single_flight": prediction_flight.stats(),
+        "result_cache": result_cache.stats(),
+        "lstm_batcher": lstm_batcher.stats(),
+        "history_buffer": prediction_buffer.stats(),
+    }
+
+
 @router.get("/history/{symbol}")
-async def get_prediction_history(symbol: str, limit: int = 10):
-    """Get prediction history for a symbol"""
-    # TODO: Fetch from database
-    return {"symbol": symbol, "predictions": []}
+def get_prediction_history(
+    symbol: str,
+    limit: int = Query(10, ge=1, le=100),
+    before: Optional[str] = None,
+    db: Session = Depends(database.get_db),
+):
+    """Get prediction history for a symbol, newest first.
+
+    Pass the returned ``next_cursor`` as ``before`` to fetch the next page
+    (``null`` on the last page).  A plain ``def`` so the query runs in the
+    threadpool rather than on the event loop.
+    """
+    clean_symbol = symbol.replace(".NS", "")
+
+    try:
+        rows = get_history(db, clean_symbol, limit, before)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    return {
+        "symbol": clean_symbol,
+        "predictions": [
+            {
+                "decision": row.decision,
+                "score": row.score,
+                "technical_score": row.technical_score,
+                "lstm_probability": row.lstm_score,
+                "timestamp": row.timestamp.isoformat(),
+            }
+            for row in rows
+        ],
+        "next_cursor": encode_cursor(rows[-1]) if len(rows) == limit else None,
+    }
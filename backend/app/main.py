@@ -1,7 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from .api import auth, prediction_routes, portfolio_routes, news_routes, alert_routes, advisor_routes, education_routes
 from .database import Base, engine
+from .ml.inference.executor import prediction_executor
+from .ml.inference.model_registry import model_registry
+from .ml.inference.screener import screener
+from .services.prediction_service import prediction_buffer
 from .utils.logger import logger
 import os
 import json
@@ -55,15 +60,35 @@ async def root():
     }
 
 
+@app.get("/ready")
+async def ready():
+    """Readiness check: which models are loaded and their warmup latency"""
+    status = model_registry.status()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Run on app startup"""
+    # load and warm models in the background; /ready reports progress
+    if model_registry.warmup:
+        model_registry.load_all(background=True)
+
+    # keep the ranked screener snapshot in step with new bars
+    screener.start()
+
+    # write served predictions to the history table in bulk
+    prediction_buffer.start()
+
     logger.info("TradeVision AI Backend started")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Run on app shutdown"""
+    screener.stop()
+    prediction_executor.shutdown(wait=False)
+    prediction_buffer.stop()
     logger.info("TradeVision AI Backend shutting down")
 
 
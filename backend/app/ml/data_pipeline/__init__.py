@@ -1,7 +1,13 @@
 # Data Pipeline package
 __all__ = [
     "fetch_prices",
+    "price_providers",
+    "downloader",
+    "price_store",
     "feature_engineering",
+    "feature_cache",
     "dataset_builder",
+    "training_shards",
     "generate_charts",
+    "chart_dataset",
 ]
@@ -0,0 +1,217 @@
+"""
+Labeled candlestick-chart dataset for CNN training.
+
+A window of ``window`` bars slides over every symbol's history with a
+step of ``stride`` bars.  Each window is rasterized with
+``render_candlestick_array`` and labeled by the forward return from its
+last close to the close ``horizon`` bars later (1 = bullish, 0 = bearish,
+matching the alphabetical class order ``train_cnn`` used to get from
+``flow_from_directory``).
+
+Symbols are rendered in a process pool.  Each worker writes its charts
+as one ``uint8`` ``<SYMBOL>.npy`` shard of shape ``(n, height, width, 3)``;
+``labels.npy`` holds every label in shard order and ``index.json`` records
+the symbols, per-shard counts and generation parameters.  Training reads
+batches straight from the memory-mapped shards through ``ChartDataset``.
+
+Usage (from the ``backend`` directory)::
+
+    python -m app.ml.data_pipeline.chart_dataset --workers 4
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from .dataset_builder import BatchedDataset
+from .generate_charts import CHART_SIZE, render_candlestick_array
+from .price_store import CLOSE, HIGH, LOW, OPEN, PRICES_DIR, REPO_ROOT, load_arrays
+
+
+CHART_SHARD_DIR = REPO_ROOT / "data" / "shards" / "charts"
+
+INDEX_FILE = "index.json"
+LABELS_FILE = "labels.npy"
+
+WINDOW = 60
+HORIZON = 5
+STRIDE = 5
+
+
+def label_windows(close, window=WINDOW, horizon=HORIZON, stride=STRIDE, threshold=0.0):
+    """Start rows and labels of every labelable window over ``close``.
+
+    A window starting at ``j`` covers bars ``j..j+window-1``; its label is
+    1 when ``close[j+window-1+horizon] / close[j+window-1] - 1 > threshold``.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    starts = np.arange(0, len(close) - window - horizon + 1, stride)
+
+    last = starts + window - 1
+    forward_return = close[last + horizon] / close[last] - 1
+
+    return starts, (forward_return > threshold).astype(np.uint8)
+
+
+def render_symbol(symbol, data_dir=PRICES_DIR, shard_dir=CHART_SHARD_DIR, window=WINDOW,
+                  horizon=HORIZON, stride=STRIDE, threshold=0.0, size=CHART_SIZE):
+    """Render and label every window of one symbol into ``<symbol>.npy``.
+
+    Returns the labels (empty when the symbol has too little history, in
+    which case no shard is written).
+    """
+    data = load_arrays(symbol, data_dir)
+    if data is None:
+        return np.empty(0, dtype=np.uint8)
+
+    starts, labels = label_windows(data[CLOSE], window, horizon, stride, threshold)
+    if len(starts) == 0:
+        return labels
+
+    bars = {
+        "Open": np.asarray(data[OPEN]),
+        "High": np.asarray(data[HIGH]),
+        "Low": np.asarray(data[LOW]),
+        "Close": np.asarray(data[CLOSE]),
+    }
+
+    images = np.empty((len(starts),) + tuple(size) + (3,), dtype=np.uint8)
+    for k, j in enumerate(starts):
+        images[k] = render_candlestick_array(
+            {col: values[j:j + window] for col, values in bars.items()}, size
+        )
+
+    np.save(Path(shard_dir) / f"{symbol}.npy", images)
+
+    return labels
+
+
+def generate_chart_dataset(data_dir=PRICES_DIR, shard_dir=CHART_SHARD_DIR, window=WINDOW,
+                           horizon=HORIZON, stride=STRIDE, threshold=0.0, size=CHART_SIZE,
+                           workers=None, symbols=None):
+    """Render labeled chart shards for every symbol in ``data_dir``.
+
+    Args:
+        data_dir: CSV price directory (read through the price store)
+        shard_dir: output directory (existing shards are replaced)
+        window: bars per chart
+        horizon: bars ahead used for the label
+        stride: bars between consecutive window starts
+        threshold: minimum forward return for a bullish label
+        size: (height, width) of each chart
+        workers: rendering processes (default: CPU count)
+        symbols: subset of symbols to render (default: every CSV)
+
+    Returns:
+        the index dict written to ``index.json``
+    """
+    shard_dir = Path(shard_dir)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    if symbols is None:
+        symbols = [p.stem for p in sorted(Path(data_dir).glob("*.csv"))]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(render_symbol, symbol, data_dir, shard_dir, window, horizon,
+                        stride, threshold, size)
+            for symbol in symbols
+        ]
+        results = [(symbol, f.result()) for symbol, f in zip(symbols, futures)]
+
+    results = [(symbol, labels) for symbol, labels in results if len(labels)]
+    labels = np.concatenate([l for _, l in results] or [np.empty(0, dtype=np.uint8)])
+    np.save(shard_dir / LABELS_FILE, labels)
+
+    index = {
+        "symbols": [symbol for symbol, _ in results],
+        "counts": [int(len(l)) for _, l in results],
+        "window": window,
+        "horizon": horizon,
+        "stride": stride,
+        "threshold": threshold,
+        "size": list(size),
+    }
+    with open(shard_dir / INDEX_FILE, "w") as f:
+        json.dump(index, f)
+
+    print(f"{len(labels)} charts from {len(index['symbols'])} symbols "
+          f"({int(labels.sum())} bullish) written to {shard_dir}")
+
+    return index
+
+
+class ChartDataset(BatchedDataset):
+    """Batched ``(X, y)`` charts read from memory-mapped shards.
+
+    ``X`` is ``float32`` scaled to ``[0, 1]`` (the old ``rescale=1./255``)
+    and ``y`` the ``float32`` binary label.
+    """
+
+    def __init__(self, shards, labels, rows, batch_size=32, shuffle=True, seed=None):
+        super().__init__(rows, batch_size, shuffle, seed)
+        self.shards = shards
+        self.labels = labels
+
+        # global row -> (shard, row inside shard)
+        counts = [len(s) for s in shards]
+        self._offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+
+    @property
+    def input_shape(self):
+        return tuple(self.shards[0].shape[1:]) if self.shards else None
+
+    def _gather(self, rows):
+        shard = np.searchsorted(self._offsets, rows, side="right") - 1
+
+        X = np.empty((len(rows),) + self.input_shape, dtype=np.float32)
+        for s in np.unique(shard):
+            mask = shard == s
+            X[mask] = self.shards[s][rows[mask] - self._offsets[s]]
+        X *= 1.0 / 255
+
+        return X, self.labels[rows].astype(np.float32)
+
+    def _groups(self):
+        # one shard per symbol, rows in time order
+        return [
+            self.samples[(self.samples >= lo) & (self.samples < hi)]
+            for lo, hi in zip(self._offsets[:-1], self._offsets[1:])
+        ]
+
+    def _subset(self, rows, shuffle, seed):
+        return ChartDataset(self.shards, self.labels, rows, self.batch_size, shuffle, seed)
+
+
+def load_chart_dataset(shard_dir=CHART_SHARD_DIR, batch_size=32, shuffle=True, seed=None):
+    """Open a chart shard directory as a lazy ``ChartDataset``"""
+    shard_dir = Path(shard_dir)
+
+    with open(shard_dir / INDEX_FILE) as f:
+        index = json.load(f)
+
+    shards = [np.load(shard_dir / f"{symbol}.npy", mmap_mode="r") for symbol in index["symbols"]]
+    labels = np.load(shard_dir / LABELS_FILE)
+    rows = np.arange(len(labels), dtype=np.int64)
+
+    return ChartDataset(shards, labels, rows, batch_size, shuffle, seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render labeled candlestick chart shards")
+    parser.add_argument("--window", type=int, default=WINDOW)
+    parser.add_argument("--horizon", type=int, default=HORIZON)
+    parser.add_argument("--stride", type=int, default=STRIDE)
+    parser.add_argument("--threshold", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    generate_chart_dataset(window=args.window, horizon=args.horizon, stride=args.stride,
+                           threshold=args.threshold, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,169 @@
-# Dataset builder for preparing training data
-def build_dataset():
-    """Build training/validation dataset"""
-    raise NotImplementedError("Dataset builder not yet implemented")
+"""
+Sliding-window dataset builder for sequence models (LSTM training).
+
+Windows are strided views (``sliding_window_view``) over one contiguous
+feature array, so the ``(n_windows, seq_len, n_features)`` tensor is never
+materialized: only the rows of the current batch are gathered.  Symbol
+boundaries are respected, so no window mixes bars from two tickers.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class BatchedDataset:
+    """Shuffled mini-batches over an array of sample ids.
+
+    Subclasses hold the data and implement ``_gather`` (ids -> ``(X, y)``),
+    ``_groups`` (ids split into time-ordered per-symbol runs) and
+    ``_subset`` (a dataset over other ids sharing the same data).
+    """
+
+    def __init__(self, samples, batch_size=32, shuffle=True, seed=None):
+        self.samples = samples
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self._rng = np.random.default_rng(seed)
+
+        self.order = np.arange(len(samples))
+        if shuffle:
+            self._rng.shuffle(self.order)
+
+    @property
+    def num_samples(self):
+        return len(self.samples)
+
+    def __len__(self):
+        """Number of batches per epoch"""
+        return -(-self.num_samples // self.batch_size)
+
+    def __getitem__(self, i):
+        """Gather batch ``i`` as ``(X, y)`` arrays"""
+        if i < 0 or i >= len(self):
+            raise IndexError(i)
+
+        return self._gather(self.samples[self.order[i * self.batch_size:(i + 1) * self.batch_size]])
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            self._rng.shuffle(self.order)
+
+    def split(self, validation_fraction):
+        """Split into (train, validation) datasets sharing the same arrays.
+
+        The last ``validation_fraction`` of each symbol's samples goes to
+        validation, so validation samples come after training samples in time.
+        """
+        train_parts, val_parts = [], []
+        for part in self._groups():
+            cut = int(round(len(part) * (1 - validation_fraction)))
+            train_parts.append(part[:cut])
+            val_parts.append(part[cut:])
+
+        empty = [np.empty(0, dtype=np.int64)]
+        seed = self._rng.integers(2 ** 32)
+        return (
+            self._subset(np.concatenate(train_parts or empty), self.shuffle, seed),
+            self._subset(np.concatenate(val_parts or empty), False, seed + 1),
+        )
+
+    def to_keras(self):
+        """Wrap as a ``keras.utils.Sequence`` for ``model.fit``"""
+        from tensorflow import keras
+
+        dataset = self
+
+        class _DatasetSequence(keras.utils.Sequence):
+
+            def __len__(self):
+                return len(dataset)
+
+            def __getitem__(self, i):
+                return dataset[i]
+
+            def on_epoch_end(self):
+                dataset.on_epoch_end()
+
+        return _DatasetSequence()
+
+    def _gather(self, ids):
+        raise NotImplementedError
+
+    def _groups(self):
+        raise NotImplementedError
+
+    def _subset(self, samples, shuffle, seed):
+        raise NotImplementedError
+
+
+class WindowDataset(BatchedDataset):
+    """Batched ``(X, y)`` windows over concatenated per-symbol series.
+
+    Sample ``k`` starting at row ``j`` is ``features[j:j + seq_len]`` with
+    target ``targets[j + seq_len]`` (the bar right after the window), the
+    same pairing as the old ``create_sequences`` loop.
+    """
+
+    def __init__(self, features, targets, starts, seq_len, batch_size=32,
+                 shuffle=True, seed=None):
+        super().__init__(starts, batch_size, shuffle, seed)
+        self.features = features
+        self.targets = targets
+        self.seq_len = seq_len
+
+        # (n_rows - seq_len + 1, seq_len, n_features) view, no copy
+        self.windows = sliding_window_view(features, seq_len, axis=0).transpose(0, 2, 1)
+
+    @property
+    def input_shape(self):
+        return (self.seq_len, self.features.shape[1])
+
+    def _gather(self, starts):
+        return self.windows[starts], self.targets[starts + self.seq_len]
+
+    def _groups(self):
+        # a symbol's windows have consecutive starts
+        bounds = np.flatnonzero(np.diff(self.samples) != 1) + 1
+        return np.split(self.samples, bounds)
+
+    def _subset(self, starts, shuffle, seed):
+        return WindowDataset(self.features, self.targets, starts, self.seq_len,
+                             self.batch_size, shuffle, seed)
+
+
+def window_starts(lengths, seq_len):
+    """Start rows of every valid window over symbols stored back to back.
+
+    A window starting at row ``j`` needs rows ``j..j+seq_len`` (inputs
+    plus target) inside one symbol's block of ``lengths``.
+    """
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+
+    return np.concatenate([
+        np.arange(offsets[k], offsets[k + 1] - seq_len, dtype=np.int64)
+        for k in range(len(lengths))
+    ] or [np.empty(0, dtype=np.int64)])
+
+
+def build_dataset(features, targets, seq_len=60, batch_size=32, shuffle=True,
+                  seed=None):
+    """Build a lazy training/validation dataset of sliding windows.
+
+    Args:
+        features: list of 2-D arrays (bars x features), one per symbol
+        targets: list of 1-D target arrays aligned with ``features``
+        seq_len: window length in bars
+        batch_size: windows per batch
+        shuffle: reshuffle window order every epoch
+        seed: RNG seed for shuffling
+
+    Returns:
+        WindowDataset
+    """
+    # one contiguous copy of the inputs; every window is a view into it
+    all_features = np.ascontiguousarray(np.concatenate(features), dtype=np.float32)
+    all_targets = np.ascontiguousarray(np.concatenate(targets), dtype=np.float32)
+
+    starts = window_starts([len(f) for f in features], seq_len)
+
+    return WindowDataset(all_features, all_targets, starts, seq_len,
+                         batch_size, shuffle, seed)
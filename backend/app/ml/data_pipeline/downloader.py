@@ -0,0 +1,125 @@
+"""
+Concurrent, rate-limited price downloader.
+
+Runs provider requests on a thread pool, throttled by a shared token
+bucket.  Failed symbols are retried with exponential backoff and jitter
+(only the failed ones when a provider reports a partial failure), and
+every symbol's outcome is reported instead of being silently dropped.
+"""
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .price_providers import ProviderError
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` requests per second.
+
+    ``capacity`` is the burst size: how many requests may start back to
+    back after the bucket has been idle.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class ConcurrentDownloader:
+    """Download symbol batches from a ``PriceProvider`` in parallel.
+
+    Args:
+        provider: any ``PriceProvider``
+        max_workers: number of requests in flight at once
+        rate: max provider requests per second (``None`` = unlimited)
+        burst: token bucket capacity when ``rate`` is set
+        max_retries: retries per symbol after the first attempt
+        backoff: delay before the first retry, doubled on each retry
+        max_backoff: upper bound for a single retry delay
+    """
+
+    def __init__(self, provider, max_workers=4, rate=None, burst=1,
+                 max_retries=3, backoff=0.5, max_backoff=10.0):
+        self.provider = provider
+        self.max_workers = max_workers
+        self.limiter = TokenBucket(rate, burst) if rate else None
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def _retry_delay(self, attempt):
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        # jitter so retries from parallel workers do not line up
+        return delay * random.uniform(0.5, 1.0)
+
+    def _download(self, symbols, start, end):
+        frames, attempts, errors = {}, {}, {}
+        pending = list(symbols)
+
+        attempt = 0
+        while pending:
+            attempt += 1
+
+            if self.limiter is not None:
+                self.limiter.acquire()
+
+            try:
+                got, failed = self.provider.download(pending, start, end), {}
+            except ProviderError as exc:
+                # keep the symbols that came back, retry only the failed ones
+                got, failed = exc.frames, exc.errors
+            except Exception as exc:
+                got, failed = {}, {symbol: exc for symbol in pending}
+
+            for symbol in pending:
+                attempts[symbol] = attempt
+                if symbol not in failed:
+                    frames[symbol] = got.get(symbol)
+
+            pending = [symbol for symbol in pending if symbol in failed]
+            if pending and attempt > self.max_retries:
+                errors.update((symbol, failed[symbol]) for symbol in pending)
+                break
+            if pending:
+                time.sleep(self._retry_delay(attempt))
+
+        return frames, attempts, errors
+
+    def run(self, requests):
+        """Execute ``(symbols, start, end)`` requests concurrently.
+
+        Yields ``(symbols, frames, attempts, errors)`` as each request
+        finishes: ``frames`` maps the symbols that succeeded to their bars,
+        ``attempts`` maps every symbol to the attempts it took and
+        ``errors`` maps each symbol whose attempts all failed to its last
+        error.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self._download, symbols, start, end): symbols
+                for symbols, start, end in requests
+            }
+
+            for future in as_completed(futures):
+                frames, attempts, errors = future.result()
+                yield futures[future], frames, attempts, errors
@@ -0,0 +1,51 @@
+"""
+In-process LRU cache of featurized price frames.
+
+Frames are keyed by symbol and data version (path, mtime and size of the
+symbol's CSV, or of its store file when no CSV exists), so a cached frame
+is reused until new bars land on disk.  Entries are evicted
+least-recently-used first once the memory budget is exceeded.
+"""
+import os
+
+from ...utils.lru_cache import LRUCache
+from .feature_engineering import build_features
+from .price_store import PRICES_DIR, data_version, load_prices
+
+
+# memory budget for cached frames, in megabytes
+FEATURE_CACHE_MB = int(os.environ.get("FEATURE_CACHE_MB", "256"))
+
+
+def frame_bytes(df):
+    """Memory used by ``df``, including object columns"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+# symbol -> (data version, featurized frame)
+feature_cache = LRUCache(FEATURE_CACHE_MB * 1024 * 1024, sizeof=frame_bytes)
+
+
+def load_features(symbol, data_dir=PRICES_DIR, cache=feature_cache):
+    """Return the featurized frame for ``symbol``, computing it at most once
+    per data version.  Returns ``None`` when no price data exists.
+
+    The returned frame is shared with other callers and must not be
+    modified in place.
+    """
+    version = data_version(symbol, data_dir)
+    if version is None:
+        return None
+
+    df = cache.get(symbol, version)
+    if df is not None:
+        return df
+
+    df = load_prices(symbol, data_dir)
+    if df is None:
+        return None
+
+    df = build_features(df)
+    cache.put(symbol, version, df)
+
+    return df
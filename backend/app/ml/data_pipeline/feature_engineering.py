@@ -2,10 +2,17 @@ import pandas as pd
 import numpy as np
 from ..indicators.indicators import (
     compute_rsi, compute_ema, compute_macd, compute_atr,
-    compute_momentum, compute_trend_slope
+    compute_momentum, compute_trend_slope, rolling_slopes
 )
 
 
+# columns added by ``build_features``, in order
+FEATURE_COLUMNS = [
+    "rsi", "ema20", "ema50", "macd", "atr", "momentum_5", "momentum_20",
+    "trend_slope", "ema_diff", "volume_change",
+]
+
+
 def build_features(df):
     """Build all features from raw OHLCV data"""
     df = df.copy()
@@ -25,3 +32,88 @@ def build_features(df):
     df = df.dropna()
 
     return df
+
+
+def build_panel_features(panel):
+    """Build all features for many symbols in one vectorized pass.
+
+    ``panel`` maps Open/High/Low/Close/Volume to aligned DataFrames
+    (dates x symbols), e.g. from ``price_store.load_panel``.  Every
+    feature is computed column-wise over the whole panel, so the cost is
+    one pandas/NumPy call per feature rather than one per symbol.
+
+    Returns a dict of column name -> DataFrame (dates x symbols) with the
+    raw OHLCV panels plus every column of ``FEATURE_COLUMNS``.  Rows are
+    not dropped; a symbol's values match ``build_features`` as long as its
+    bars are contiguous in the panel (no interior missing dates), which
+    ``load_panel(..., align="bars")`` guarantees.
+    """
+    close = panel["Close"]
+    volume = panel["Volume"]
+
+    features = {col: panel[col] for col in ["Open", "High", "Low", "Close", "Volume"]}
+
+    features["rsi"] = compute_rsi(close)
+    features["ema20"] = compute_ema(close, 20)
+    features["ema50"] = compute_ema(close, 50)
+    features["macd"] = compute_macd(close)
+    features["atr"] = compute_atr(panel)
+    # same as pct_change(n), without padding across a symbol's leading NaNs
+    features["momentum_5"] = close / close.shift(5) - 1
+    features["momentum_20"] = close / close.shift(20) - 1
+    features["trend_slope"] = pd.DataFrame(
+        rolling_slopes(close.values, [10])[10], index=close.index, columns=close.columns
+    )
+
+    features["ema_diff"] = features["ema20"] - features["ema50"]
+    features["volume_change"] = volume / volume.shift() - 1
+
+    return features
+
+
+def _row_dates(features, dates):
+    """``rows x symbols`` array of bar dates: ``dates`` or the panel index"""
+    if dates is not None:
+        return dates.values
+    index = features["Close"].index.values
+    return np.repeat(index[:, None], features["Close"].shape[1], axis=1)
+
+
+def panel_latest(features, dates=None):
+    """Return each symbol's most recent complete feature row.
+
+    The result is a DataFrame indexed by symbol with a ``Date`` column
+    plus the OHLCV and feature columns, i.e. what ``build_features(df)
+    .iloc[-1]`` gives per symbol.  Symbols without a complete row are
+    omitted.  ``dates`` is the ``Date`` frame of a bar-aligned panel;
+    otherwise the panel index holds the dates.
+    """
+    columns = list(features)
+    values = np.stack([features[col].values for col in columns])  # cols x dates x symbols
+
+    complete = ~np.isnan(values).any(axis=0)
+    has_row = complete.any(axis=0)
+    # index of the last complete date per symbol
+    last = complete.shape[0] - 1 - np.argmax(complete[::-1], axis=0)
+
+    symbols = np.arange(values.shape[2])[has_row]
+    rows = values[:, last[has_row], symbols].T
+
+    latest = pd.DataFrame(rows, index=features["Close"].columns[has_row], columns=columns)
+    latest.insert(0, "Date", _row_dates(features, dates)[last[has_row], symbols])
+
+    return latest
+
+
+def panel_to_frames(features, dates=None):
+    """Split panel features into per-symbol frames shaped like
+    ``build_features`` output (``Date`` column, incomplete rows dropped).
+    ``dates`` is as for ``panel_latest``."""
+    row_dates = _row_dates(features, dates)
+
+    frames = {}
+    for j, symbol in enumerate(features["Close"].columns):
+        df = pd.DataFrame({col: panel[symbol].values for col, panel in features.items()})
+        df.insert(0, "Date", row_dates[:, j])
+        frames[symbol] = df.dropna().reset_index(drop=True)
+    return frames
@@ -1,51 +1,193 @@
 import os
-import yfinance as yf
+import sys
+import tempfile
 import pandas as pd
 from datetime import datetime, timedelta
+from pathlib import Path
 
+from .downloader import ConcurrentDownloader
+from .feature_cache import feature_cache
+from .price_providers import YFinanceProvider
+from .price_store import DATE, convert_symbol, load_arrays, read_price_csv
 
-def fetch_last_5_years_daily(symbol_csv_path):
-    """Fetch 5-year daily OHLCV data for all symbols in CSV"""
 
+HISTORY_DAYS = 5 * 365
+
+# tickers sent to the provider in one request
+BATCH_SIZE = 20
+
+# provider requests in flight at once, and max requests per second.  The
+# live yfinance provider serializes its calls, so more workers only help
+# providers that are safe to call concurrently.
+MAX_WORKERS = 1
+RATE_LIMIT = 2.0
+
+
+def load_symbols(symbol_csv_path):
+    """Read the symbol universe from the first column of a CSV"""
     symbols_df = pd.read_csv(symbol_csv_path)
 
     # Automatically detect first column
     first_column = symbols_df.columns[0]
-    symbols = symbols_df[first_column].dropna().tolist()
+    return symbols_df[first_column].dropna().tolist()
+
+
+def _batches(symbols, batch_size):
+    for i in range(0, len(symbols), batch_size):
+        yield symbols[i:i + batch_size]
+
+
+def _write_csv_atomic(df, file_path):
+    """Write ``df`` next to ``file_path`` and rename it into place"""
+    fd, tmp_path = tempfile.mkstemp(dir=Path(file_path).parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            df.to_csv(f, index=False, date_format="%Y-%m-%d")
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def save_bars(clean_name, df, data_dir="data/prices", append=False):
+    """Atomically store bars for ``clean_name`` and refresh its price store.
+
+    With ``append=True`` the new bars are merged after the existing history
+    (later downloads win on duplicate dates); otherwise the file is replaced.
+    Returns the total number of stored bars.
+    """
+    file_path = Path(data_dir) / f"{clean_name}.csv"
+
+    if append and file_path.exists():
+        df = pd.concat([read_price_csv(file_path), df], ignore_index=True)
+        df = df.drop_duplicates(subset="Date", keep="last").sort_values("Date")
+
+    _write_csv_atomic(df, file_path)
+    convert_symbol(clean_name, data_dir)
+    feature_cache.invalidate(clean_name)
+
+    return len(df)
+
+
+def last_stored_date(clean_name, data_dir="data/prices"):
+    """Return the date of the newest stored bar, or ``None`` if there is none"""
+    data = load_arrays(clean_name, data_dir)
+    if data is None or data.shape[1] == 0:
+        return None
+    return pd.Timestamp(int(data[DATE][-1]), unit="s")
+
+
+def _download_and_save(requests, provider, data_dir, append, max_workers, rate):
+    """Run ``(symbols, start, end)`` requests concurrently and save results.
+
+    Returns a per-symbol report of
+    ``{"status": "ok" | "no_data" | "failed", "bars", "attempts", "error"}``.
+    """
+    downloader = ConcurrentDownloader(provider, max_workers=max_workers, rate=rate)
+    report = {}
+
+    for symbols, frames, attempts, errors in downloader.run(requests):
+        for symbol in symbols:
+            entry = {"status": "ok", "bars": 0, "attempts": attempts[symbol], "error": None}
+
+            error = errors.get(symbol)
+            if error is not None:
+                entry.update(status="failed", error=str(error))
+                print(f"Failed {symbol} after {attempts[symbol]} attempts: {error}")
+            else:
+                df = frames.get(symbol)
+                if df is None or df.empty:
+                    entry["status"] = "no_data"
+                else:
+                    clean_name = symbol.replace(".NS", "")
+                    save_bars(clean_name, df, data_dir, append=append)
+                    entry["bars"] = len(df)
 
-    os.makedirs("data/prices", exist_ok=True)
+            report[symbol] = entry
+
+    return report
+
+
+def _summarize(report):
+    counts = {}
+    for entry in report.values():
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+    return ", ".join(f"{n} {status}" for status, n in sorted(counts.items())) or "nothing to do"
+
+
+def fetch_last_5_years_daily(symbol_csv_path, provider=None, data_dir="data/prices",
+                             batch_size=BATCH_SIZE, max_workers=MAX_WORKERS,
+                             rate=RATE_LIMIT):
+    """Fetch 5-year daily OHLCV data for all symbols in CSV.
+
+    Returns the per-symbol download report.
+    """
+
+    provider = provider or YFinanceProvider()
+    symbols = load_symbols(symbol_csv_path)
+
+    os.makedirs(data_dir, exist_ok=True)
 
     # Dynamic dates
-    end_date = datetime.today()
-    start_date = end_date - timedelta(days=5*365)
+    end_date = pd.Timestamp(datetime.today().date())
+    start_date = end_date - timedelta(days=HISTORY_DAYS)
 
-    for symbol in symbols:
+    print(f"Downloading 5-year daily data for {len(symbols)} symbols...")
 
-        print(f"Downloading 5-year daily data for {symbol}...")
+    requests = [(batch, start_date, end_date) for batch in _batches(symbols, batch_size)]
+    report = _download_and_save(requests, provider, data_dir, False, max_workers, rate)
 
-        df = yf.download(
-            symbol,
-            start=start_date.strftime("%Y-%m-%d"),
-            end=end_date.strftime("%Y-%m-%d"),
-            interval="1d"
-        )
+    print(f"All 5-year daily downloads complete: {_summarize(report)}.")
 
-        if df.empty:
-            print(f"No data for {symbol}")
-            continue
+    return report
 
-        df.reset_index(inplace=True)
 
-        # Keep only required columns
-        df = df[["Date", "Open", "High", "Low", "Close", "Volume"]]
+def fetch_incremental_daily(symbol_csv_path, provider=None, data_dir="data/prices",
+                            batch_size=BATCH_SIZE, max_workers=MAX_WORKERS,
+                            rate=RATE_LIMIT):
+    """Fetch only the bars missing since each symbol's last stored date.
+
+    Symbols without any stored history get the full 5-year backfill.
+    Symbols sharing the same first missing date are downloaded together,
+    ``batch_size`` tickers per provider request.
+
+    Returns the per-symbol download report (up-to-date symbols are omitted).
+    """
+
+    provider = provider or YFinanceProvider()
+    symbols = load_symbols(symbol_csv_path)
+
+    os.makedirs(data_dir, exist_ok=True)
+
+    end_date = pd.Timestamp(datetime.today().date())
+    default_start = end_date - timedelta(days=HISTORY_DAYS)
+
+    # group symbols by first missing date so each request shares one range
+    pending = {}
+    for symbol in symbols:
+        last_date = last_stored_date(symbol.replace(".NS", ""), data_dir)
+        start_date = default_start if last_date is None else last_date + timedelta(days=1)
+
+        if start_date >= end_date:
+            continue
+
+        pending.setdefault(start_date, []).append(symbol)
 
-        clean_name = symbol.replace(".NS", "")
-        df.to_csv(f"data/prices/{clean_name}.csv", index=False)
+    requests = [
+        (batch, start_date, end_date)
+        for start_date, group in pending.items()
+        for batch in _batches(group, batch_size)
+    ]
+    report = _download_and_save(requests, provider, data_dir, True, max_workers, rate)
 
-        print(f"Saved {clean_name}.csv")
+    print(f"Incremental update complete for {len(symbols)} symbols: {_summarize(report)}.")
 
-    print("All 5-year daily downloads complete.")
+    return report
 
 
 if __name__ == "__main__":
-    fetch_last_5_years_daily("data/nifty100_symbols.csv")
+    if "--full" in sys.argv[1:]:
+        fetch_last_5_years_daily("data/nifty100_symbols.csv")
+    else:
+        fetch_incremental_daily("data/nifty100_symbols.csv")
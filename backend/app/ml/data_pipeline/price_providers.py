@@ -0,0 +1,187 @@
+"""
+Market data providers used by the price ingestion pipeline.
+
+A provider turns ``(symbols, start, end)`` into one clean daily OHLCV
+DataFrame per symbol.  ``fetch_prices`` only talks to this interface, so
+tests can swap the live ``yfinance`` backend for a local fixture provider.
+"""
+import random
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from .price_store import COLUMNS, read_price_csv
+
+
+class ProviderError(Exception):
+    """A provider request failed for some of its symbols (worth retrying).
+
+    ``errors`` maps each failed symbol to its error and ``frames`` holds
+    the bars of the symbols that succeeded, so callers keep those and
+    retry only the failures.
+    """
+
+    def __init__(self, errors, frames=None):
+        self.errors = dict(errors)
+        self.frames = dict(frames or {})
+        super().__init__("; ".join(f"{symbol}: {error}" for symbol, error in self.errors.items()))
+
+
+class PriceProvider:
+    """Base class for daily OHLCV providers"""
+
+    def download(self, symbols, start, end):
+        """Fetch bars for ``symbols`` with ``start <= Date < end``.
+
+        Returns a dict of ``symbol -> DataFrame`` with the columns
+        ``Date, Open, High, Low, Close, Volume``.  Symbols without data
+        in the range map to an empty DataFrame.  When only some symbols
+        fail, raises ``ProviderError`` carrying the others' frames.
+        """
+        raise NotImplementedError
+
+
+def _clean_frame(df):
+    """Normalize a provider frame to the stored column layout"""
+    if df is None or df.empty:
+        return pd.DataFrame(columns=COLUMNS)
+
+    df = df.reset_index()
+    if "Date" not in df.columns:
+        df = df.rename(columns={df.columns[0]: "Date"})
+
+    df["Date"] = pd.to_datetime(df["Date"]).dt.tz_localize(None).dt.normalize()
+    df = df[COLUMNS].dropna()
+
+    return df.reset_index(drop=True)
+
+
+class YFinanceProvider(PriceProvider):
+    """Live provider that batches many tickers into one ``yf.download`` call.
+
+    ``yf.download`` keeps each call's results and errors in module globals
+    (``yfinance.shared``) that every call resets, so calls are serialized
+    behind a lock: running several downloader workers against this
+    provider adds no concurrency (``fetch_prices`` defaults to one).  The
+    tickers of one call are still fetched in parallel by yfinance itself.
+
+    yfinance never raises for a failed ticker, so the errors it records
+    are checked and turned into a ``ProviderError`` that names only the
+    failed tickers and carries the frames of the rest.
+    """
+
+    _lock = threading.Lock()
+
+    # yfinance's message for a valid ticker with no bars in the range
+    NO_DATA_MARKERS = ("no price data found", "no timezone found", "possibly delisted")
+
+    def download(self, symbols, start, end):
+        import yfinance as yf
+        from yfinance import shared
+
+        symbols = list(symbols)
+
+        with self._lock:
+            data = yf.download(
+                symbols,
+                start=pd.Timestamp(start).strftime("%Y-%m-%d"),
+                end=pd.Timestamp(end).strftime("%Y-%m-%d"),
+                interval="1d",
+                group_by="ticker",
+                auto_adjust=False,
+                progress=False,
+            )
+            errors = dict(shared._ERRORS)
+
+        failed = {
+            ticker: error for ticker, error in errors.items()
+            if ticker in symbols
+            and not any(marker in str(error).lower() for marker in self.NO_DATA_MARKERS)
+        }
+
+        frames = {}
+        for symbol in symbols:
+            if symbol in failed:
+                continue
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    if symbol in errors:  # a no-data error: nothing to store
+                        frames[symbol] = _clean_frame(None)
+                    else:
+                        failed[symbol] = "missing from the yfinance response"
+                    continue
+                frame = data[symbol]
+            else:
+                frame = data
+            frames[symbol] = _clean_frame(frame)
+
+        if failed:
+            raise ProviderError(failed, frames)
+
+        return frames
+
+
+class CSVFixtureProvider(PriceProvider):
+    """Offline provider serving bars from ``<fixture_dir>/<SYMBOL>.csv``.
+
+    Symbols are looked up without their exchange suffix, matching the
+    file names written by ``fetch_prices``.  Every call is recorded in
+    ``requests`` so tests can assert on batching and date ranges.
+    """
+
+    def __init__(self, fixture_dir):
+        self.fixture_dir = Path(fixture_dir)
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def download(self, symbols, start, end):
+        symbols = list(symbols)
+        with self._lock:
+            self.requests.append((symbols, pd.Timestamp(start), pd.Timestamp(end)))
+
+        frames = {}
+        for symbol in symbols:
+            path = self.fixture_dir / f"{symbol.replace('.NS', '')}.csv"
+            if not path.exists():
+                frames[symbol] = pd.DataFrame(columns=COLUMNS)
+                continue
+
+            df = read_price_csv(path)
+            mask = (df["Date"] >= pd.Timestamp(start)) & (df["Date"] < pd.Timestamp(end))
+            frames[symbol] = df[mask].reset_index(drop=True)
+
+        return frames
+
+
+class FlakyProvider(PriceProvider):
+    """Stub wrapper that adds latency and random failures to a provider.
+
+    Used to exercise retries, rate limiting and concurrency offline.
+    ``latency`` seconds are slept per request and each request raises
+    ``ConnectionError`` with probability ``error_rate``.
+    """
+
+    def __init__(self, provider, latency=0.0, error_rate=0.0, seed=None):
+        self.provider = provider
+        self.latency = latency
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.failures = 0
+
+    def download(self, symbols, start, end):
+        with self._lock:
+            self.calls += 1
+            fail = self._rng.random() < self.error_rate
+            if fail:
+                self.failures += 1
+
+        time.sleep(self.latency)
+
+        if fail:
+            raise ConnectionError(f"injected failure for {', '.join(symbols)}")
+
+        return self.provider.download(symbols, start, end)
@@ -0,0 +1,242 @@
+"""
+Columnar price store backed by memory-mapped NumPy arrays.
+
+Each symbol's cleaned daily OHLCV history is saved as a single ``float64``
+array of shape ``(6, n_bars)`` in ``data/price_store/<SYMBOL>.npy``.  Each
+row holds one column (Date as epoch seconds, Open, High, Low, Close, Volume),
+so a column is contiguous on disk and is read through ``np.load(mmap_mode="r")``
+without any text parsing.
+
+The CSV files in ``data/prices`` remain the source of truth: when a CSV is
+newer than its store file, the store file is rebuilt on the next read.
+"""
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+PRICES_DIR = REPO_ROOT / "data" / "prices"
+
+COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+PRICE_COLUMNS = COLUMNS[1:]
+
+# row index of each column inside a stored array
+DATE, OPEN, HIGH, LOW, CLOSE, VOLUME = range(len(COLUMNS))
+
+
+def store_dir_for(data_dir=PRICES_DIR):
+    """Return the store directory that mirrors a CSV price directory"""
+    return Path(data_dir).parent / "price_store"
+
+
+def read_price_csv(file_path):
+    """Parse a raw price CSV into a clean numeric OHLCV DataFrame.
+
+    Non-numeric rows (e.g. the extra ticker header rows written by newer
+    yfinance versions) are coerced to NaN and dropped.
+    """
+    df = pd.read_csv(file_path)
+
+    for col in PRICE_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+
+    # older exports name the date column after the index ("Price")
+    date_col = "Date" if "Date" in df.columns else df.columns[0]
+
+    # daily bars only: keep the calendar date and ignore any time/offset part
+    df["Date"] = pd.to_datetime(
+        df[date_col].astype(str).str.slice(0, 10), format="%Y-%m-%d", errors="coerce"
+    )
+
+    df = df[COLUMNS].dropna()
+
+    return df.reset_index(drop=True)
+
+
+def frame_to_array(df):
+    """Pack a clean OHLCV DataFrame into the ``(6, n)`` store layout"""
+    data = np.empty((len(COLUMNS), len(df)), dtype=np.float64)
+
+    data[DATE] = df["Date"].values.astype("datetime64[s]").astype(np.int64)
+    for i, col in enumerate(PRICE_COLUMNS, start=1):
+        data[i] = df[col].values
+
+    return data
+
+
+def write_array(data, store_path):
+    """Atomically write a store array so readers never see a partial file"""
+    store_path = Path(store_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=store_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, np.ascontiguousarray(data))
+        os.replace(tmp_path, store_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def convert_symbol(symbol, data_dir=PRICES_DIR):
+    """Convert one ``<symbol>.csv`` into the store; returns the bar count"""
+    csv_path = Path(data_dir) / f"{symbol}.csv"
+    data = frame_to_array(read_price_csv(csv_path))
+    write_array(data, store_dir_for(data_dir) / f"{symbol}.npy")
+    return data.shape[1]
+
+
+def load_arrays(symbol, data_dir=PRICES_DIR):
+    """Return the memory-mapped ``(6, n)`` array for ``symbol``.
+
+    Rebuilds the store file from the CSV when it is missing or stale.
+    Returns ``None`` when neither a CSV nor a store file exists.
+    """
+    csv_path = Path(data_dir) / f"{symbol}.csv"
+    store_path = store_dir_for(data_dir) / f"{symbol}.npy"
+
+    csv_exists = csv_path.exists()
+    store_exists = store_path.exists()
+
+    if not csv_exists and not store_exists:
+        return None
+
+    if csv_exists and (
+        not store_exists
+        or store_path.stat().st_mtime < csv_path.stat().st_mtime
+    ):
+        convert_symbol(symbol, data_dir)
+
+    return np.load(store_path, mmap_mode="r")
+
+
+def data_version(symbol, data_dir=PRICES_DIR):
+    """Return a version token that changes whenever ``symbol``'s bars change.
+
+    The token is the path, mtime and size of the symbol's CSV, or of its
+    store file when no CSV exists; ``None`` when there is neither.
+    """
+    for path in (Path(data_dir) / f"{symbol}.csv", store_dir_for(data_dir) / f"{symbol}.npy"):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        return (str(path), stat.st_mtime_ns, stat.st_size)
+    return None
+
+
+# (data_dir, symbol) -> (data version, last bar time)
+_last_bar_memo = {}
+
+
+def last_bar_time(symbol, data_dir=PRICES_DIR):
+    """Epoch seconds of ``symbol``'s most recent bar (``None`` if no data).
+
+    Remembered per ``data_version``, so repeated calls cost one ``stat``
+    instead of mapping the store file.
+    """
+    key = (str(data_dir), symbol)
+    version = data_version(symbol, data_dir)
+    if version is None:
+        _last_bar_memo.pop(key, None)
+        return None
+
+    cached = _last_bar_memo.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    data = load_arrays(symbol, data_dir)
+    value = None if data is None or data.shape[1] == 0 else float(data[DATE, -1])
+    _last_bar_memo[key] = (version, value)
+    return value
+
+
+def load_prices(symbol, data_dir=PRICES_DIR):
+    """Load ``symbol`` as a clean OHLCV DataFrame (``None`` if unavailable)"""
+    data = load_arrays(symbol, data_dir)
+    if data is None:
+        return None
+
+    df = pd.DataFrame({col: data[i] for i, col in enumerate(COLUMNS)})
+    df["Date"] = data[DATE].astype(np.int64).astype("datetime64[s]").astype("datetime64[ns]")
+
+    return df
+
+
+def load_panel(symbols, data_dir=PRICES_DIR, align="date"):
+    """Load many symbols as aligned ``rows x symbols`` DataFrames.
+
+    Returns a dict mapping each of Open/High/Low/Close/Volume to a
+    DataFrame with one column per symbol.  Symbols without data are
+    omitted.
+
+    ``align="date"`` indexes rows by the union of all dates (NaN where a
+    symbol has no bar), so a symbol missing a bar others have gets a gap
+    in its history.  ``align="bars"`` instead lines up each symbol's own
+    bars from the most recent one backwards (row ``-1`` is every symbol's
+    last bar, NaN-padded at the start), so per-column rolling features
+    see each history without gaps; the dict then also holds ``"Date"``,
+    a frame of each bar's date.
+    """
+    columns = {col: {} for col in PRICE_COLUMNS}
+    dates = {}
+
+    for symbol in symbols:
+        data = load_arrays(symbol, data_dir)
+        if data is None or data.shape[1] == 0:
+            continue
+
+        dates[symbol] = data[DATE].astype(np.int64).astype("datetime64[s]").astype("datetime64[ns]")
+        for i, col in enumerate(PRICE_COLUMNS, start=1):
+            columns[col][symbol] = data[i]
+
+    if align == "date":
+        return {
+            col: pd.DataFrame({
+                symbol: pd.Series(values, index=pd.DatetimeIndex(dates[symbol], name="Date"))
+                for symbol, values in series.items()
+            })
+            for col, series in columns.items()
+        }
+
+    if align != "bars":
+        raise ValueError(f"unknown panel alignment: {align}")
+
+    n_rows = max((len(d) for d in dates.values()), default=0)
+    index = pd.RangeIndex(n_rows, name="Bar")
+
+    def right_aligned(series, fill, dtype):
+        out = np.full((n_rows, len(series)), fill, dtype=dtype)
+        for j, values in enumerate(series.values()):
+            out[n_rows - len(values):, j] = values
+        return pd.DataFrame(out, index=index, columns=list(series))
+
+    panel = {col: right_aligned(series, np.nan, np.float64) for col, series in columns.items()}
+    panel["Date"] = right_aligned(dates, np.datetime64("NaT"), "datetime64[ns]")
+    return panel
+
+
+def convert_all(data_dir=PRICES_DIR):
+    """One-shot conversion of every CSV in ``data_dir`` into the store"""
+    data_dir = Path(data_dir)
+
+    for csv_path in sorted(data_dir.glob("*.csv")):
+        symbol = csv_path.stem
+        try:
+            bars = convert_symbol(symbol, data_dir)
+        except Exception as exc:
+            print(f"Skipped {symbol}: {exc}")
+            continue
+        print(f"Stored {symbol} ({bars} bars)")
+
+    print(f"Price store written to {store_dir_for(data_dir)}")
+
+
+if __name__ == "__main__":
+    convert_all()
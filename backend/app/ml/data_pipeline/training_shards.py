@@ -0,0 +1,124 @@
+"""
+Out-of-core preparation of LSTM training data.
+
+Featurized symbols are consumed one at a time, so peak memory is bounded
+by the largest single symbol rather than the whole universe:
+
+1. each symbol's raw feature/target rows are written to a temporary
+   per-symbol shard while a ``MinMaxScaler`` is fitted with ``partial_fit``;
+2. once the scaler is final, every shard is scaled and copied into its
+   row range of one memory-mapped ``features.npy`` / ``targets.npy`` pair.
+
+Several target columns (e.g. one per forecast horizon) can share one set
+of scaled features; ``targets.npy`` holds one column per target.
+``index.json`` records each symbol's row range, and training reads
+batches straight from the memory-mapped arrays through ``WindowDataset``.
+"""
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+from numpy.lib.format import open_memmap
+from sklearn.preprocessing import MinMaxScaler
+
+from .dataset_builder import WindowDataset, window_starts
+
+
+INDEX_FILE = "index.json"
+FEATURES_FILE = "features.npy"
+TARGETS_FILE = "targets.npy"
+
+
+def write_training_shards(frames, feature_cols, shard_dir, target_col="target"):
+    """Scale featurized frames into an on-disk training set.
+
+    Args:
+        frames: iterable of ``(symbol, DataFrame)``; consumed once, so a
+            generator that featurizes symbols lazily keeps memory flat
+        feature_cols: model input columns
+        shard_dir: output directory (existing shard files are replaced)
+        target_col: column holding the training target, or a list of
+            target columns (NaN targets are skipped when loading)
+
+    Returns:
+        the fitted MinMaxScaler
+    """
+    target_cols = [target_col] if isinstance(target_col, str) else list(target_col)
+    n_features = len(feature_cols)
+
+    shard_dir = Path(shard_dir)
+    raw_dir = shard_dir / "raw"
+    raw_dir.mkdir(parents=True, exist_ok=True)
+
+    scaler = MinMaxScaler()
+    symbols, lengths = [], []
+
+    # pass 1: stream symbols, fit the scaler, stash raw rows per symbol
+    for symbol, df in frames:
+        if df.empty:
+            continue
+
+        values = df[list(feature_cols) + target_cols].values.astype(np.float64)
+        scaler.partial_fit(values[:, :n_features])
+        np.save(raw_dir / f"{symbol}.npy", values)
+
+        symbols.append(symbol)
+        lengths.append(len(values))
+
+    total = int(sum(lengths))
+    features = open_memmap(shard_dir / FEATURES_FILE, mode="w+", dtype=np.float32,
+                           shape=(total, n_features))
+    targets = open_memmap(shard_dir / TARGETS_FILE, mode="w+", dtype=np.float32,
+                          shape=(total, len(target_cols)))
+
+    # pass 2: scale each symbol into its row range with the final scaler
+    row = 0
+    for symbol, length in zip(symbols, lengths):
+        raw_path = raw_dir / f"{symbol}.npy"
+        values = np.load(raw_path)
+
+        features[row:row + length] = scaler.transform(values[:, :n_features])
+        targets[row:row + length] = values[:, n_features:]
+        row += length
+
+        os.remove(raw_path)
+
+    features.flush()
+    targets.flush()
+    del features, targets
+    raw_dir.rmdir()
+
+    index = {
+        "symbols": symbols,
+        "lengths": lengths,
+        "feature_cols": list(feature_cols),
+        "target_cols": target_cols,
+    }
+    with open(shard_dir / INDEX_FILE, "w") as f:
+        json.dump(index, f)
+
+    return scaler
+
+
+def load_training_shards(shard_dir, seq_len=60, batch_size=32, shuffle=True, seed=None,
+                         target_col=None):
+    """Open a shard directory as a lazy ``WindowDataset`` over memory maps.
+
+    ``target_col`` selects one of the stored targets (default: the first);
+    windows whose target is NaN are left out.
+    """
+    shard_dir = Path(shard_dir)
+
+    with open(shard_dir / INDEX_FILE) as f:
+        index = json.load(f)
+
+    column = index["target_cols"].index(target_col) if target_col else 0
+
+    features = np.load(shard_dir / FEATURES_FILE, mmap_mode="r")
+    targets = np.load(shard_dir / TARGETS_FILE, mmap_mode="r")[:, column]
+
+    starts = window_starts(index["lengths"], seq_len)
+    starts = starts[~np.isnan(targets[starts + seq_len])]
+
+    return WindowDataset(features, targets, starts, seq_len, batch_size, shuffle, seed)
@@ -1,2 +1,2 @@
 # Indicators package - technical analysis indicators
-__all__ = ["indicators"]
+__all__ = ["indicators", "streaming", "patterns"]
@@ -37,7 +37,9 @@ def compute_atr(df, period=14):
     high_close = np.abs(df["High"] - df["Close"].shift())
     low_close = np.abs(df["Low"] - df["Close"].shift())
 
-    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    # element-wise max ignoring NaN, so this also works on
+    # (dates x symbols) panels as well as single-symbol frames
+    tr = np.fmax(np.fmax(high_low, high_close), low_close)
     return tr.rolling(period).mean()
 
 
@@ -46,11 +48,72 @@ def compute_momentum(series, period=5):
     return series.pct_change(period)
 
 
+def rolling_slopes(values, windows):
+    """Least-squares slope of each trailing window of ``values``, for
+    every window size in ``windows``, from one set of cumulative sums.
+
+    Closed form: with x = 0..w-1 inside each window,
+    slope = (w*Sxy - Sx*Sy) / (w*Sxx - Sx^2), where Sy and Sxy are
+    differences of the cumulative sums of y and i*y.  Works along axis 0,
+    so ``values`` may be 1-D or a 2-D (dates x symbols) array.  Windows
+    that are incomplete or contain NaN give NaN, like ``rolling().apply``.
+
+    Returns a dict of ``window -> array`` shaped like ``values``.
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = y.shape[0]
+
+    missing = np.isnan(y)
+    if missing.all():
+        return {w: np.full(y.shape, np.nan) for w in windows}
+
+    # the slope is shift-invariant; centering y keeps the cumulative sums small
+    # (an all-NaN column of a panel is centered on 0, it never has a slope)
+    y = np.where(missing, 0.0, y)
+    y = np.where(missing, 0.0, y - y.sum(axis=0) / np.maximum((~missing).sum(axis=0), 1))
+
+    idx = np.arange(n, dtype=np.float64).reshape((n,) + (1,) * (y.ndim - 1))
+    zero = np.zeros((1,) + y.shape[1:])
+    cs_y = np.concatenate([zero, np.cumsum(y, axis=0)])
+    cs_iy = np.concatenate([zero, np.cumsum(idx * y, axis=0)])
+    cs_nan = np.concatenate([zero, np.cumsum(missing, axis=0)])
+
+    slopes = {}
+    for w in windows:
+        out = np.full(y.shape, np.nan)
+
+        if 2 <= w <= n:
+            sy = cs_y[w:] - cs_y[:-w]
+            # shift the global index i to the window-local x = i - start
+            sxy = (cs_iy[w:] - cs_iy[:-w]) - idx[: n - w + 1] * sy
+
+            sx = w * (w - 1) / 2.0
+            sxx = (w - 1) * w * (2 * w - 1) / 6.0
+            slope = (w * sxy - sx * sy) / (w * sxx - sx * sx)
+
+            has_nan = (cs_nan[w:] - cs_nan[:-w]) > 0
+            out[w - 1:] = np.where(has_nan, np.nan, slope)
+
+        slopes[w] = out
+
+    return slopes
+
+
 def compute_trend_slope(series, window=10):
-    """Compute Trend Slope using polynomial fitting"""
-    return series.rolling(window).apply(
-        lambda x: np.polyfit(range(len(x)), x, 1)[0],
-        raw=False
+    """Compute Trend Slope (rolling linear-regression slope)"""
+    slope = rolling_slopes(series.values, [window])[window]
+    return pd.Series(slope, index=series.index, name=series.name)
+
+
+def compute_trend_slopes(series, windows=(10, 20, 50)):
+    """Compute trend slopes for several window sizes in one pass.
+
+    Returns a DataFrame with one ``trend_slope_<window>`` column per window.
+    """
+    slopes = rolling_slopes(series.values, windows)
+    return pd.DataFrame(
+        {f"trend_slope_{w}": slopes[w] for w in windows},
+        index=series.index,
     )
 
 
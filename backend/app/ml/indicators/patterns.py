@@ -0,0 +1,105 @@
+"""
+Vectorized candlestick pattern detection.
+
+Every pattern is evaluated for every bar at once from the OHLC arrays and
+copies of them shifted by one and two bars, so detection is linear in the
+length of the history.  Inputs may be 1-D (one symbol's bars) or 2-D
+(dates x symbols panels); bars without enough history never match.
+
+``detect_patterns`` returns boolean arrays for live scoring
+(``scoring_engine.pattern_score``), and ``pattern_frame`` returns the same
+flags as DataFrame columns for training datasets.
+"""
+import numpy as np
+import pandas as pd
+
+
+# in the order pattern_score lists them
+PATTERNS = (
+    "hammer",
+    "shooting_star",
+    "bullish_engulfing",
+    "bearish_engulfing",
+    "doji",
+    "morning_star",
+    "evening_star",
+    "three_white_soldiers",
+    "three_black_crows",
+)
+
+
+def _shift(values, n):
+    """``values`` moved ``n`` bars later along axis 0, NaN-padded"""
+    out = np.full_like(values, np.nan)
+    out[n:] = values[:-n]
+    return out
+
+
+def detect_patterns(ohlc):
+    """Flag each candlestick pattern on every bar.
+
+    ``ohlc`` maps Open/High/Low/Close to equally shaped arrays (a price
+    DataFrame or a panel dict).  Returns a dict of pattern name -> boolean
+    array of that shape.
+    """
+    o = np.asarray(ohlc["Open"], dtype=float)
+    h = np.asarray(ohlc["High"], dtype=float)
+    l = np.asarray(ohlc["Low"], dtype=float)
+    c = np.asarray(ohlc["Close"], dtype=float)
+
+    body = c - o
+    body_height = np.abs(body)
+    total_range = h - l
+    has_range = total_range > 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        body_ratio = np.where(has_range, body_height / total_range, 0.0)
+        lower_wick_ratio = (np.minimum(o, c) - l) / total_range
+        upper_wick_ratio = (h - np.maximum(o, c)) / total_range
+
+    upper_wick = h - np.maximum(o, c)
+    lower_wick = np.minimum(o, c) - l
+
+    prev_o, prev_c = _shift(o, 1), _shift(c, 1)
+    prev_body = _shift(body, 1)
+    prev_body_height = np.abs(prev_body)
+    prev_ratio = _shift(body_ratio, 1)
+
+    first_o, first_c = _shift(o, 2), _shift(c, 2)
+    first_body = _shift(body, 2)
+    first_ratio = _shift(body_ratio, 2)
+    first_mid = (first_o + first_c) / 2
+
+    bullish = body > 0
+    prev_bullish, first_bullish = prev_body > 0, first_body > 0
+    prev_bearish, first_bearish = prev_body < 0, first_body < 0
+
+    return {
+        # small body, long lower wick, closing up
+        "hammer": has_range & (lower_wick_ratio > 0.6) & (body_ratio < 0.3) & (c > prev_c),
+        # small body, long upper wick, closing down
+        "shooting_star": has_range & (upper_wick_ratio > 0.6) & (body_ratio < 0.3) & (c < prev_c),
+        "bullish_engulfing": (body > 1.3 * prev_body_height) & (c > prev_o),
+        "bearish_engulfing": (body < -1.3 * prev_body_height) & (c < prev_o),
+        # small body with balanced wicks
+        "doji": (body_ratio < 0.15) & (np.abs(upper_wick - lower_wick) < 0.005 * c),
+        # long bearish bar, small-bodied bar, bullish bar closing past the first bar's midpoint
+        "morning_star": first_bearish & (first_ratio > 0.6) & (prev_ratio < 0.3)
+                        & bullish & (c > first_mid),
+        "evening_star": first_bullish & (first_ratio > 0.6) & (prev_ratio < 0.3)
+                        & (body < 0) & (c < first_mid),
+        # three consecutive bars in one direction, each closing beyond the last
+        "three_white_soldiers": first_bullish & prev_bullish & bullish
+                                & (prev_c > first_c) & (c > prev_c),
+        "three_black_crows": first_bearish & prev_bearish & (body < 0)
+                             & (prev_c < first_c) & (c < prev_c),
+    }
+
+
+def pattern_frame(df):
+    """``detect_patterns`` as ``pattern_<name>`` int8 columns on ``df``'s index"""
+    flags = detect_patterns(df)
+    return pd.DataFrame(
+        {f"pattern_{name}": flags[name].astype(np.int8) for name in PATTERNS},
+        index=df.index,
+    )
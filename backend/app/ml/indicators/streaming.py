@@ -0,0 +1,233 @@
+"""
+Streaming (online) counterparts of the batch indicators in ``indicators.py``.
+
+Each indicator is a small ``__slots__`` object that consumes one bar per
+``update`` call in O(1) time and returns the indicator value for that bar
+(``nan`` while warming up, exactly where the batch version has NaN).
+Indicator state can be captured with ``snapshot()`` and rebuilt with
+``restore()``, e.g. to persist per-symbol state between price updates.
+
+Inputs are expected to be finite; the batch versions should be used to
+seed state from history that may contain gaps.
+"""
+import copy
+import math
+from collections import deque
+
+
+NAN = float("nan")
+
+
+class StreamingIndicator:
+    """Base class providing snapshot/restore over ``__slots__``"""
+
+    __slots__ = ()
+
+    def _slot_names(self):
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                yield name
+
+    def snapshot(self):
+        """Return a picklable, independent copy of the indicator state"""
+        return {
+            "type": type(self).__name__,
+            "state": {name: copy.deepcopy(getattr(self, name)) for name in self._slot_names()},
+        }
+
+    @classmethod
+    def restore(cls, snapshot):
+        """Rebuild an indicator from ``snapshot()`` output"""
+        if snapshot["type"] != cls.__name__:
+            raise ValueError(f"snapshot of {snapshot['type']} cannot restore {cls.__name__}")
+
+        obj = cls.__new__(cls)
+        for name, value in snapshot["state"].items():
+            setattr(obj, name, copy.deepcopy(value))
+        return obj
+
+
+class RollingWindow(StreamingIndicator):
+    """Fixed-size window keeping a running sum and sum of squares.
+
+    Sums are recomputed from the buffer every time the window wraps, so
+    floating-point drift stays bounded on arbitrarily long streams.
+    """
+
+    __slots__ = ("size", "buf", "pos", "count", "total", "total_sq")
+
+    def __init__(self, size):
+        self.size = size
+        self.buf = [0.0] * size
+        self.pos = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def push(self, value):
+        old = self.buf[self.pos]
+        self.buf[self.pos] = value
+        self.pos = (self.pos + 1) % self.size
+
+        if self.count < self.size:
+            self.count += 1
+            self.total += value
+            self.total_sq += value * value
+        elif self.pos == 0:
+            self.total = math.fsum(self.buf)
+            self.total_sq = math.fsum(v * v for v in self.buf)
+        else:
+            self.total += value - old
+            self.total_sq += value * value - old * old
+
+    @property
+    def full(self):
+        return self.count == self.size
+
+    def mean(self):
+        return self.total / self.size if self.full else NAN
+
+    def std(self):
+        """Sample standard deviation (``ddof=1``), like ``Series.rolling().std()``"""
+        if not self.full or self.size < 2:
+            return NAN
+        var = (self.total_sq - self.total * self.total / self.size) / (self.size - 1)
+        return math.sqrt(max(var, 0.0))
+
+
+class StreamingEMA(StreamingIndicator):
+    """Online ``compute_ema`` (``ewm(span, adjust=False)``)"""
+
+    __slots__ = ("alpha", "value")
+
+    def __init__(self, span):
+        self.alpha = 2.0 / (span + 1.0)
+        self.value = NAN
+
+    def update(self, close):
+        if math.isnan(self.value):
+            self.value = float(close)
+        else:
+            self.value += self.alpha * (close - self.value)
+        return self.value
+
+
+class StreamingMACD(StreamingIndicator):
+    """Online ``compute_macd`` (EMA12 - EMA26)"""
+
+    __slots__ = ("fast", "slow")
+
+    def __init__(self):
+        self.fast = StreamingEMA(12)
+        self.slow = StreamingEMA(26)
+
+    def update(self, close):
+        return self.fast.update(close) - self.slow.update(close)
+
+
+class StreamingRSI(StreamingIndicator):
+    """Online ``compute_rsi`` using simple rolling averages of gains/losses"""
+
+    __slots__ = ("gains", "losses", "prev_close")
+
+    def __init__(self, period=14):
+        self.gains = RollingWindow(period)
+        self.losses = RollingWindow(period)
+        self.prev_close = NAN
+
+    def update(self, close):
+        prev, self.prev_close = self.prev_close, float(close)
+        if math.isnan(prev):
+            return NAN
+
+        delta = close - prev
+        self.gains.push(max(delta, 0.0))
+        self.losses.push(max(-delta, 0.0))
+
+        if not self.gains.full:
+            return NAN
+
+        rs = self.gains.mean() / (self.losses.mean() + 1e-10)
+        return 100 - (100 / (1 + rs))
+
+
+class StreamingATR(StreamingIndicator):
+    """Online ``compute_atr`` (rolling mean of the true range)"""
+
+    __slots__ = ("true_ranges", "prev_close")
+
+    def __init__(self, period=14):
+        self.true_ranges = RollingWindow(period)
+        self.prev_close = NAN
+
+    def update(self, high, low, close):
+        tr = high - low
+        if not math.isnan(self.prev_close):
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = float(close)
+
+        self.true_ranges.push(tr)
+        return self.true_ranges.mean()
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    """Online ``compute_bollinger_bands``; ``update`` returns (upper, sma, lower)"""
+
+    __slots__ = ("window", "std_dev")
+
+    def __init__(self, period=20, std_dev=2):
+        self.window = RollingWindow(period)
+        self.std_dev = std_dev
+
+    def update(self, close):
+        self.window.push(float(close))
+        sma = self.window.mean()
+        std = self.window.std()
+        return sma + self.std_dev * std, sma, sma - self.std_dev * std
+
+
+class StreamingStochastic(StreamingIndicator):
+    """Online ``compute_stochastic``; ``update`` returns (k, d).
+
+    Rolling extremes use monotonic deques, so each bar costs O(1) amortized.
+    """
+
+    __slots__ = ("period", "index", "lows", "highs", "k_window")
+
+    def __init__(self, period=14):
+        self.period = period
+        self.index = -1
+        self.lows = deque()    # (index, low), lows increasing
+        self.highs = deque()   # (index, high), highs decreasing
+        self.k_window = RollingWindow(3)
+
+    def update(self, high, low, close):
+        self.index += 1
+        oldest = self.index - self.period + 1
+
+        while self.lows and self.lows[-1][1] >= low:
+            self.lows.pop()
+        self.lows.append((self.index, low))
+        while self.lows[0][0] < oldest:
+            self.lows.popleft()
+
+        while self.highs and self.highs[-1][1] <= high:
+            self.highs.pop()
+        self.highs.append((self.index, high))
+        while self.highs[0][0] < oldest:
+            self.highs.popleft()
+
+        if oldest < 0:
+            return NAN, NAN
+
+        low_min = self.lows[0][1]
+        high_max = self.highs[0][1]
+        k = 100 * ((close - low_min) / (high_max - low_min)) if high_max != low_min else NAN
+
+        if math.isnan(k):
+            # a NaN %K keeps %D undefined until it leaves the 3-bar window
+            self.k_window = RollingWindow(3)
+            return k, NAN
+
+        self.k_window.push(k)
+        return k, self.k_window.mean()
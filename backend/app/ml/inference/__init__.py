@@ -5,4 +5,11 @@ __all__ = [
     "hybrid_decision",
     "confidence_engine",
     "explanation",
+    "model_registry",
+    "batcher",
+    "executor",
+    "batch_predict",
+    "screener",
+    "result_cache",
+    "single_flight",
 ]
@@ -0,0 +1,90 @@
+"""
+Batch predictions for watchlists and whole universes.
+
+Symbols are processed in chunks.  Each chunk is loaded in bulk from the
+price store as a panel aligned by bar offset (each symbol's own bars,
+ending at its latest one), featurized and scored column-wise, and its
+LSTM probabilities come from one batched forward pass.  Results are
+yielded as soon as their chunk is done, so a streaming response can
+deliver the first symbols before the rest are computed.
+"""
+from pathlib import Path
+
+import numpy as np
+
+from ..data_pipeline.feature_engineering import build_panel_features, panel_latest, panel_to_frames
+from ..data_pipeline.price_store import load_panel
+from ..model.lstm_predict import predict_lstm_many
+from ..scoring_engine.final_score import calculate_final_scores
+from .predict import DATA_PATH, hybrid_result
+
+
+# symbols featurized and scored together
+CHUNK_SIZE = 25
+
+
+def all_symbols(data_dir=DATA_PATH):
+    """Every symbol with price data"""
+    return [p.stem for p in sorted(Path(data_dir).glob("*.csv"))]
+
+
+def _plain(value):
+    """NumPy scalars -> Python numbers, for JSON encoding"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def predict_chunk(symbols, data_dir=DATA_PATH):
+    """Predict a list of symbols together; returns results in input order.
+
+    Symbols without data get ``{"symbol": ..., "error": ...}``.
+    """
+    clean = {symbol: symbol.replace(".NS", "") for symbol in symbols}
+
+    # by bar offset, so a symbol missing a date others have keeps contiguous
+    # history and its features match load_features exactly
+    panel = load_panel(sorted(set(clean.values())), data_dir, align="bars")
+
+    row = {}
+    if not panel["Close"].empty:
+        features = build_panel_features(panel)
+        latest = panel_latest(features, panel["Date"])
+
+        frames = panel_to_frames({col: values[latest.index] for col, values in features.items()},
+                                 panel["Date"][latest.index])
+        lstm_probs = predict_lstm_many(frames)
+
+        scores, _, explanations = calculate_final_scores(latest)
+        row = {name: i for i, name in enumerate(latest.index)}
+        close = latest["Close"].values
+        dates = latest["Date"].values
+
+    results = []
+    for symbol in symbols:
+        i = row.get(clean[symbol])
+        if i is None:
+            results.append({"symbol": symbol, "error": "Stock data not found"})
+            continue
+
+        result = hybrid_result(symbol, close[i], scores[i], lstm_probs[clean[symbol]],
+                               explanations[i], dates[i])
+        results.append({key: _plain(value) for key, value in result.items()})
+
+    return results
+
+
+def chunks(symbols, chunk_size=CHUNK_SIZE):
+    """Split ``symbols`` into lists of at most ``chunk_size``"""
+    return [symbols[i:i + chunk_size] for i in range(0, len(symbols), chunk_size)]
+
+
+def predict_batch(symbols, chunk_size=CHUNK_SIZE, data_dir=DATA_PATH):
+    """Yield one result dict per symbol, chunk by chunk.
+
+    ``symbols`` is a list of symbols or ``"all"`` for every symbol with
+    price data.
+    """
+    if symbols == "all":
+        symbols = all_symbols(data_dir)
+
+    for chunk in chunks(symbols, chunk_size):
+        yield from predict_chunk(chunk, data_dir)
@@ -0,0 +1,126 @@
+"""
+Micro-batching dispatcher for model inference.
+
+Concurrent callers (request handlers running in worker threads) submit
+single items; a dispatcher thread collects them until ``max_batch_size``
+items are queued or ``max_wait_ms`` has passed since the first one, runs
+them through the batch function as one forward pass and resolves each
+caller's future.  A lone request therefore waits at most ``max_wait_ms``
+extra, while a burst is served by a handful of batched calls.
+
+Configuration (environment):
+    INFERENCE_MAX_BATCH    maximum items per batch (default 32)
+    INFERENCE_MAX_WAIT_MS  maximum wait for a batch to fill (default 5)
+"""
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+
+
+MAX_BATCH_SIZE = int(os.environ.get("INFERENCE_MAX_BATCH", "32"))
+MAX_WAIT_MS = float(os.environ.get("INFERENCE_MAX_WAIT_MS", "5"))
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-item calls into batched calls.
+
+    ``batch_fn`` takes a list of items and returns a list of results in
+    the same order.  If it raises, every caller in that batch gets the
+    exception.
+    """
+
+    def __init__(self, batch_fn, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS,
+                 name="batcher"):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.name = name
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self.batch_sizes = Counter()
+        self.batches = 0
+        self.items = 0
+        self.errors = 0
+
+    def submit(self, item):
+        """Queue ``item`` and return a ``Future`` for its result"""
+        self._ensure_started()
+
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def __call__(self, item, timeout=None):
+        """Submit ``item`` and block until its result is ready"""
+        return self.submit(item).result(timeout)
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                    self._thread.start()
+
+    def _collect(self):
+        """Block for the first item, then gather more until full or timed out"""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    # past the deadline: still take whatever is already queued
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+
+            # drop callers that gave up (future cancelled) before dispatch
+            batch = [(item, f) for item, f in batch if f.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            try:
+                results = self.batch_fn([item for item, _ in batch])
+            except Exception as exc:
+                with self._stats_lock:
+                    self.errors += 1
+                for _, future in batch:
+                    future.set_exception(exc)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+
+            with self._stats_lock:
+                self.batch_sizes[len(batch)] += 1
+                self.batches += 1
+                self.items += len(batch)
+
+    def stats(self):
+        """Batch-size distribution and totals"""
+        with self._stats_lock:
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+                "batches": self.batches,
+                "items": self.items,
+                "errors": self.errors,
+                "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+                "batch_sizes": {str(size): n for size, n in sorted(self.batch_sizes.items())},
+                "queued": self._queue.qsize(),
+            }
@@ -1,7 +1,9 @@
 import os
+import threading
+
 import numpy as np
-from tensorflow.keras.models import load_model
-from tensorflow.keras.preprocessing import image
+
+from ..data_pipeline.generate_charts import render_candlestick_array
 
 # project root directory
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
@@ -10,23 +12,97 @@ MODEL_PATH = os.path.join(BASE_DIR, "models/cnn/cnn_pattern.keras")
 
 IMG_SIZE = (128,128)
 
-model = load_model(MODEL_PATH)
+# charts per forward pass
+BATCH_SIZE = 256
 
+# Lazy-load model so importing this module never pulls in TensorFlow
+_model = None
+_model_lock = threading.Lock()
 
-def predict_chart(img_path):
 
-    img = image.load_img(img_path, target_size=IMG_SIZE)
+def _load_model():
+    """Load the CNN from disk on first use (``None`` if unavailable)"""
+    global _model
 
-    img = image.img_to_array(img)
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                try:
+                    from tensorflow.keras.models import load_model
+                except ImportError:
+                    return None
+
+                if not os.path.exists(MODEL_PATH):
+                    return None
+
+                _model = load_model(MODEL_PATH)
+
+    return _model
+
+
+def _label(prob):
+    return "bullish" if prob > 0.5 else "bearish"
+
+
+def predict_charts(charts, batch_size=BATCH_SIZE):
+    """Classify many in-memory charts with as few forward passes as possible.
+
+    Args:
+        charts: sequence (or stacked array) of ``IMG_SIZE + (3,)`` RGB
+            images, ``uint8`` in 0-255 as produced by
+            ``render_candlestick_array``; or a dict mapping symbol to image
+        batch_size: maximum charts per forward pass
 
-    img = img / 255.0
+    Returns:
+        list of ``(label, confidence)`` in input order, or a dict keyed by
+        symbol when ``charts`` is a dict; ``("neutral", 0.5)`` per chart
+        when the model is not available
+    """
+    if isinstance(charts, dict):
+        symbols = list(charts)
+        results = predict_charts([charts[s] for s in symbols], batch_size)
+        return dict(zip(symbols, results))
 
-    img = np.expand_dims(img, axis=0)
+    if len(charts) == 0:
+        return []
 
-    prob = model.predict(img, verbose=0)[0][0]
+    batch = np.asarray(charts, dtype=np.float32)
+    if batch.shape[1:] != IMG_SIZE + (3,):
+        raise ValueError(f"expected charts of shape {IMG_SIZE + (3,)}, got {batch.shape[1:]}")
 
-    label = "bullish" if prob > 0.5 else "bearish"
+    model = _load_model()
+    if model is None:
+        return [("neutral", 0.5)] * len(batch)
 
-    confidence = float(prob)
+    batch *= 1.0 / 255
+
+    probs = np.concatenate([
+        np.asarray(model.predict_on_batch(batch[i:i + batch_size])).reshape(-1)
+        for i in range(0, len(batch), batch_size)
+    ])
+
+    return [(_label(p), float(p)) for p in probs]
+
+
+def predict_frames(frames, window=60, batch_size=BATCH_SIZE):
+    """Render each symbol's last ``window`` bars in memory and classify them.
+
+    ``frames`` maps symbol to an OHLC DataFrame; returns a dict of
+    ``(label, confidence)`` keyed by symbol.
+    """
+    charts = {
+        symbol: render_candlestick_array(df.iloc[-window:], IMG_SIZE)
+        for symbol, df in frames.items()
+    }
+
+    return predict_charts(charts, batch_size)
+
+
+def predict_chart(img_path):
+    from tensorflow.keras.preprocessing import image
+
+    img = image.load_img(img_path, target_size=IMG_SIZE)
+
+    img = image.img_to_array(img)
 
-    return label, confidence
\ No newline at end of file
+    return predict_charts([img])[0]
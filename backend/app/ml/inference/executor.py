@@ -0,0 +1,118 @@
+"""
+Bounded executor that keeps blocking prediction work off the event loop.
+
+``predict_stock`` is synchronous (file I/O, pandas, model inference), so
+async route handlers hand it to ``BoundedExecutor.run``, which runs it in a
+thread or process pool.  At most ``max_workers`` calls run at once and at
+most ``max_queue`` more wait for a worker; beyond that ``run`` raises
+``ExecutorSaturated`` immediately so the route can answer 503 instead of
+piling up work.  Each call is also bounded by ``timeout`` seconds.
+
+Configuration (environment):
+    PREDICTION_EXECUTOR   "thread" (default) or "process"
+    PREDICTION_WORKERS    concurrent predictions (default 4)
+    PREDICTION_QUEUE      predictions allowed to wait for a worker (default 16)
+    PREDICTION_TIMEOUT_S  per-request timeout in seconds (default 15)
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+EXECUTOR_KIND = os.environ.get("PREDICTION_EXECUTOR", "thread")
+MAX_WORKERS = int(os.environ.get("PREDICTION_WORKERS", "4"))
+MAX_QUEUE = int(os.environ.get("PREDICTION_QUEUE", "16"))
+TIMEOUT_S = float(os.environ.get("PREDICTION_TIMEOUT_S", "15"))
+
+
+class ExecutorSaturated(Exception):
+    """Raised when every worker is busy and the wait queue is full"""
+
+
+class BoundedExecutor:
+    """Thread/process pool with admission control and per-call timeouts"""
+
+    def __init__(self, max_workers=MAX_WORKERS, max_queue=MAX_QUEUE, timeout=TIMEOUT_S,
+                 kind=EXECUTOR_KIND):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.kind = kind
+
+        self._pool = None
+        self._lock = threading.Lock()
+
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+
+    def _get_pool(self):
+        if self._pool is None:
+            if self.kind == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="prediction")
+        return self._pool
+
+    def _release(self, _future):
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def run(self, fn, *args, timeout=None):
+        """Run ``fn(*args)`` in the pool and await its result.
+
+        Raises ``ExecutorSaturated`` without queueing when the pool and its
+        queue are full, and ``asyncio.TimeoutError`` after ``timeout``
+        seconds (the call keeps its worker until it finishes, so it still
+        counts against capacity).
+        """
+        with self._lock:
+            if self.in_flight >= self.max_workers + self.max_queue:
+                self.rejected += 1
+                raise ExecutorSaturated(
+                    f"{self.in_flight} predictions in flight (limit {self.max_workers + self.max_queue})"
+                )
+            self.in_flight += 1
+
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except BaseException:
+            with self._lock:
+                self.in_flight -= 1
+            raise
+
+        # capacity is released when the work finishes, not when the caller stops waiting
+        future.add_done_callback(self._release)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future),
+                                          self.timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            raise
+
+    def stats(self):
+        with self._lock:
+            return {
+                "kind": self.kind,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "timeout_s": self.timeout,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+            }
+
+    def shutdown(self, wait=False):
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+prediction_executor = BoundedExecutor()
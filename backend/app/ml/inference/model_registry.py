@@ -0,0 +1,179 @@
+"""
+Model lifecycle: lazy/background loading, warmup and readiness.
+
+Each managed model wraps the predictor module's own lazy loader, so a
+request that arrives before warmup finishes simply loads the model
+itself.  ``load_all`` loads every model (in a background thread by
+default) and runs one dummy inference per model, so graph tracing is paid
+at startup instead of by the first user request.  ``status`` backs the
+``/ready`` endpoint and also reports models a request loaded lazily.
+
+With ``MODEL_WARMUP=0`` nothing is loaded at startup and the service is
+ready immediately; models load on first use.
+"""
+import os
+import threading
+import time
+
+import numpy as np
+
+from ...utils.logger import logger
+
+
+# model states reported by /ready
+NOT_LOADED = "not_loaded"
+LOADING = "loading"
+READY = "ready"
+UNAVAILABLE = "unavailable"   # model file or TensorFlow missing
+FAILED = "failed"
+
+MODEL_WARMUP = os.environ.get("MODEL_WARMUP", "1") != "0"
+
+
+class ManagedModel:
+    """One model with its loader, a warmup input and a probe that returns
+    the predictor's loaded model (or ``None``) without loading it"""
+
+    def __init__(self, name, loader, warmup, probe=None):
+        self.name = name
+        self._loader = loader
+        self._warmup = warmup
+        self._probe = probe
+        self._lock = threading.Lock()
+
+        self.state = NOT_LOADED
+        self.load_ms = None
+        self.warmup_ms = None
+        self.error = None
+
+    def load(self):
+        """Load and warm the model once; later calls are no-ops"""
+        with self._lock:
+            if self.state != NOT_LOADED:
+                return self.state
+
+            self.state = LOADING
+
+            try:
+                t0 = time.perf_counter()
+                model = self._loader()
+                self.load_ms = (time.perf_counter() - t0) * 1000
+
+                if model is None:
+                    self.state = UNAVAILABLE
+                    return self.state
+
+                t0 = time.perf_counter()
+                self._warmup(model)
+                self.warmup_ms = (time.perf_counter() - t0) * 1000
+
+                self.state = READY
+            except Exception as exc:
+                self.error = str(exc)
+                self.state = FAILED
+                logger.error(f"Loading model {self.name} failed: {exc}")
+
+            return self.state
+
+    @property
+    def current_state(self):
+        """``state``, or ``ready`` if a request has since loaded the model lazily"""
+        if self.state in (NOT_LOADED, UNAVAILABLE) and self._probe is not None and self._probe() is not None:
+            return READY
+        return self.state
+
+    def status(self):
+        return {
+            "state": self.current_state,
+            "load_ms": None if self.load_ms is None else round(self.load_ms, 1),
+            "warmup_ms": None if self.warmup_ms is None else round(self.warmup_ms, 1),
+            "error": self.error,
+        }
+
+
+class ModelRegistry:
+    """Named collection of ``ManagedModel`` instances"""
+
+    def __init__(self, warmup=MODEL_WARMUP):
+        self.models = {}
+        self.warmup = warmup
+        self._thread = None
+
+    def register(self, name, loader, warmup, probe=None):
+        self.models[name] = ManagedModel(name, loader, warmup, probe)
+        return self.models[name]
+
+    def load_all(self, background=True):
+        """Load and warm every registered model.
+
+        With ``background=True`` loading runs in a daemon thread and this
+        returns immediately; ``status()`` reports progress.
+        """
+        def run():
+            for model in self.models.values():
+                state = model.load()
+                logger.info(f"Model {model.name}: {state} "
+                            f"(load {model.load_ms or 0:.0f} ms, warmup {model.warmup_ms or 0:.0f} ms)")
+
+        if not background:
+            run()
+            return None
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=run, name="model-warmup", daemon=True)
+            self._thread.start()
+
+        return self._thread
+
+    @property
+    def ready(self):
+        """True once no model is still waiting to load.
+
+        Unavailable or failed models do not block readiness: the
+        predictors fall back to neutral outputs without them.  Without
+        warmup, models load on first use and never block readiness.
+        """
+        if not self.warmup:
+            return True
+        return all(m.current_state not in (NOT_LOADED, LOADING) for m in self.models.values())
+
+    def status(self):
+        return {
+            "ready": self.ready,
+            "models": {name: m.status() for name, m in self.models.items()},
+        }
+
+
+def _load_lstm():
+    from ..model import lstm_predict
+    return lstm_predict._load_model()
+
+
+def _probe_lstm():
+    from ..model import lstm_predict
+    return lstm_predict._model
+
+
+def _warmup_lstm(model):
+    from ..model.lstm_predict import SEQUENCE_LENGTH
+    model.predict(np.zeros((1, SEQUENCE_LENGTH, 5), dtype=np.float32), verbose=0)
+
+
+def _load_cnn():
+    from . import cnn_predict
+    return cnn_predict._load_model()
+
+
+def _probe_cnn():
+    from . import cnn_predict
+    return cnn_predict._model
+
+
+def _warmup_cnn(model):
+    from .cnn_predict import IMG_SIZE
+    model.predict_on_batch(np.zeros((1,) + IMG_SIZE + (3,), dtype=np.float32))
+
+
+model_registry = ModelRegistry()
+model_registry.register("lstm", _load_lstm, _warmup_lstm, _probe_lstm)
+model_registry.register("cnn", _load_cnn, _warmup_cnn, _probe_cnn)
@@ -1,36 +1,103 @@
-import pandas as pd
-import os
+import asyncio
 from pathlib import Path
 
-from ..data_pipeline.feature_engineering import build_features
-from ..scoring_engine.final_score import calculate_final_score
-from ..model.lstm_predict import predict_lstm
+import pandas as pd
+
+from ..data_pipeline.feature_cache import load_features
+from ..data_pipeline.price_store import last_bar_time
+from ..scoring_engine.final_score import SCORING_VERSION, calculate_final_score
+from ..model.lstm_predict import model_version, predict_lstm_many
+from .batcher import MicroBatcher
+from .result_cache import result_cache
 
 
 REPO_ROOT = Path(__file__).resolve().parents[4]
 DATA_PATH = REPO_ROOT / "data" / "prices"
 
 
-def predict_stock(symbol):
-    """Main prediction endpoint - returns trading decision and confidence"""
+def _predict_lstm_batch(frames):
+    """Score a list of frames in one forward pass, preserving order"""
+    return list(predict_lstm_many(dict(enumerate(frames))).values())
 
-    clean_symbol = symbol.replace(".NS", "")
-    file_path = DATA_PATH / f"{clean_symbol}.csv"
 
-    if not file_path.exists():
+# concurrent predictions share batched LSTM forward passes.  The API path
+# (predict_stock_async) waits for the batcher on the event loop, not in an
+# executor worker, so batches can grow past the executor's worker count.
+lstm_batcher = MicroBatcher(_predict_lstm_batch, name="lstm-batcher")
+
+
+def prediction_version(symbol):
+    """Result cache version for ``symbol`` (``None`` when it has no data)"""
+    last_bar = last_bar_time(symbol.replace(".NS", ""), DATA_PATH)
+    if last_bar is None:
         return None
+    return (last_bar, model_version(), SCORING_VERSION)
+
 
-    df = pd.read_csv(file_path)
+def predict_stock(symbol, cache=result_cache):
+    """Main prediction endpoint - returns trading decision and confidence
 
-    for col in ["Open", "High", "Low", "Close", "Volume"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    Results are cached until a new bar lands, the model files change or
+    ``SCORING_VERSION`` changes.  The returned dict may be shared with
+    other callers and must not be modified in place.
+    """
 
-    df = df.dropna()
+    version = prediction_version(symbol)
+    if version is None:
+        return None
 
-    # Build technical features
-    df = build_features(df)
+    result = cache.get(symbol, version)
+    if result is None:
+        result = compute_prediction(symbol)
+        if result is not None:
+            cache.put(symbol, version, result)
+
+    return result
 
-    if df.empty:
+
+async def predict_stock_async(symbol, run, cache=result_cache, timeout=None):
+    """``predict_stock`` for async callers.
+
+    ``run(fn, *args)`` executes the CPU-bound feature and scoring step,
+    e.g. ``BoundedExecutor.run``.  The cache lookup runs in a plain thread
+    and the LSTM probability is awaited from ``lstm_batcher`` on the event
+    loop, so neither holds an executor worker.  ``timeout`` bounds the
+    wait for the batcher.
+    """
+    version = await asyncio.to_thread(prediction_version, symbol)
+    if version is None:
+        return None
+
+    result = cache.get(symbol, version)
+    if result is not None:
+        return result
+
+    prepared = await run(prepare_prediction, symbol)
+    if prepared is None:
+        return None
+
+    df, latest, indicator_score, explanation = prepared
+    lstm_prob = await asyncio.wait_for(asyncio.wrap_future(lstm_batcher.submit(df)), timeout)
+
+    result = hybrid_result(symbol, latest["Close"], indicator_score, lstm_prob, explanation,
+                           latest["Date"])
+    cache.put(symbol, version, result)
+    return result
+
+
+def prepare_prediction(symbol):
+    """Features and technical score for ``symbol``.
+
+    Returns ``(features, latest_row, indicator_score, explanation)`` or
+    ``None`` when there is no data.
+    """
+
+    clean_symbol = symbol.replace(".NS", "")
+
+    # Technical features, reused from the cache until new bars arrive
+    df = load_features(clean_symbol, DATA_PATH)
+
+    if df is None or df.empty:
         return None
 
     latest = df.iloc[-1]
@@ -38,13 +105,36 @@ def predict_stock(symbol):
     # Calculate technical score
     indicator_score, decision, explanation = calculate_final_score(latest)
 
+    return df, latest, indicator_score, explanation
+
+
+def compute_prediction(symbol):
+    """Score ``symbol`` from its features, bypassing the result cache"""
+
+    prepared = prepare_prediction(symbol)
+    if prepared is None:
+        return None
+
+    df, latest, indicator_score, explanation = prepared
+
     # Get LSTM probability
-    lstm_prob = predict_lstm(df)
+    lstm_prob = lstm_batcher(df)
+
+    return hybrid_result(symbol, latest["Close"], indicator_score, lstm_prob, explanation,
+                         latest["Date"])
+
+
+def hybrid_result(symbol, close, indicator_score, lstm_prob, explanation, date=None):
+    """Blend the technical score and LSTM probability into the response dict.
+
+    ``date`` is the date of the bar the prediction was made from.
+    """
+
     lstm_score = lstm_prob * 100
 
     # Calculate target and stop loss
-    target_price = latest["Close"] * 1.05  # Example: 5% above the current price
-    stop_loss = latest["Close"] * 0.95  # Example: 5% below the current price
+    target_price = close * 1.05  # Example: 5% above the current price
+    stop_loss = close * 0.95  # Example: 5% below the current price
 
     # Hybrid final score (60% technical, 40% LSTM)
     final_score = (indicator_score * 0.6) + (lstm_score * 0.4)
@@ -65,7 +155,8 @@ def predict_stock(symbol):
         "score": final_score,
         "technical_score": indicator_score,
         "lstm_probability": lstm_score,
-        "latest_price": latest["Close"],
+        "latest_price": close,
+        "date": None if date is None else pd.Timestamp(date).strftime("%Y-%m-%d"),
         "target": target_price,
         "stop": stop_loss,
         "explanation": explanation,
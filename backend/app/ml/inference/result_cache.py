@@ -0,0 +1,22 @@
+"""
+In-process LRU cache of prediction results.
+
+A daily-bar prediction only changes when a new bar lands, the model is
+reloaded or the scoring rules change, so results are keyed by
+``(last bar timestamp, model version, scoring version)`` per symbol.  A
+lookup whose version differs from the stored one is a miss, which makes
+invalidation automatic on ingest and when the model files change on disk
+(``lstm_predict.model_version`` reloads them); each symbol keeps only
+its latest entry.
+"""
+import os
+
+from ...utils.lru_cache import LRUCache
+
+
+# maximum cached symbols
+PREDICTION_CACHE_SIZE = int(os.environ.get("PREDICTION_CACHE_SIZE", "1024"))
+
+
+# symbol -> ((last bar, model version, scoring version), result)
+result_cache = LRUCache(PREDICTION_CACHE_SIZE)
@@ -0,0 +1,128 @@
+"""
+Ranked universe screener.
+
+The whole symbol universe is scored in bulk (``batch_predict``) and the
+ranked result is kept in memory as a snapshot.  For every sort key the
+snapshot holds the results pre-sorted, overall and per decision, so a
+screener request only slices a list: its cost depends on ``top``, not on
+the size of the universe.
+
+A background thread re-scores the universe whenever the price data, the
+model or the scoring rules change (checked every ``SCREENER_REFRESH_S``
+seconds).
+"""
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from ..data_pipeline.price_store import data_version
+from ..model.lstm_predict import model_version
+from ..scoring_engine.final_score import SCORING_VERSION
+from ..data_pipeline.fetch_prices import load_symbols
+from ...utils.logger import logger
+from .batch_predict import all_symbols, predict_batch
+from .predict import DATA_PATH, REPO_ROOT
+
+
+SYMBOLS_CSV = REPO_ROOT / "data" / "nifty100_symbols.csv"
+
+# seconds between checks for new bars (0 disables the background refresh)
+SCREENER_REFRESH_S = float(os.environ.get("SCREENER_REFRESH_S", "60"))
+
+SORT_KEYS = ("score", "technical_score", "lstm_probability", "latest_price")
+DECISIONS = ("Strong Buy", "Buy", "Hold", "Avoid")
+
+
+def universe_symbols(symbols_csv=SYMBOLS_CSV, data_dir=DATA_PATH):
+    """Symbols from the universe CSV, or every symbol with price data"""
+    if Path(symbols_csv).exists():
+        return load_symbols(symbols_csv)
+    return all_symbols(data_dir)
+
+
+class ScreenerSnapshot:
+    """Immutable ranked results with pre-sorted views"""
+
+    def __init__(self, results, version):
+        self.results = results
+        self.version = version
+        self.as_of = datetime.utcnow().isoformat()
+
+        # views[(sort_key, decision or None)] -> results sorted descending
+        self.views = {}
+        for key in SORT_KEYS:
+            ranked = sorted(results, key=lambda r: r[key], reverse=True)
+            self.views[(key, None)] = ranked
+            for decision in DECISIONS:
+                self.views[(key, decision)] = [r for r in ranked if r["decision"] == decision]
+
+    def query(self, top=20, decision=None, sort="score", ascending=False):
+        """Top ``top`` results for ``sort``, optionally of one ``decision``"""
+        ranked = self.views[(sort, decision)]
+        if ascending:
+            return ranked[max(len(ranked) - top, 0):][::-1]
+        return ranked[:top]
+
+
+class Screener:
+    """Holds the current snapshot and keeps it in step with the price data"""
+
+    def __init__(self, symbols_csv=SYMBOLS_CSV, data_dir=DATA_PATH,
+                 refresh_interval=SCREENER_REFRESH_S):
+        self.symbols_csv = symbols_csv
+        self.data_dir = data_dir
+        self.refresh_interval = refresh_interval
+
+        self.snapshot = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def _version(self, symbols):
+        clean = [s.replace(".NS", "") for s in symbols]
+        data = tuple(data_version(s, self.data_dir) for s in clean)
+        return (model_version(), SCORING_VERSION, data)
+
+    def refresh(self, force=False):
+        """Re-score the universe if its data or model changed; returns the snapshot"""
+        with self._lock:
+            symbols = universe_symbols(self.symbols_csv, self.data_dir)
+            version = self._version(symbols)
+
+            if force or self.snapshot is None or self.snapshot.version != version:
+                t0 = time.perf_counter()
+                results = [r for r in predict_batch(symbols, data_dir=self.data_dir)
+                           if "error" not in r]
+                self.snapshot = ScreenerSnapshot(results, version)
+                logger.info(f"Screener scored {len(results)} symbols "
+                            f"in {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+            return self.snapshot
+
+    def get(self):
+        """Current snapshot, built on first use"""
+        return self.snapshot or self.refresh()
+
+    def start(self):
+        """Refresh in a background thread until ``stop`` is called"""
+        if self._thread is not None or self.refresh_interval <= 0:
+            return
+
+        def run():
+            while not self._stop.is_set():
+                try:
+                    self.refresh()
+                except Exception as exc:
+                    logger.error(f"Screener refresh failed: {exc}")
+                self._stop.wait(self.refresh_interval)
+
+        self._thread = threading.Thread(target=run, name="screener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+
+screener = Screener()
@@ -0,0 +1,64 @@
+"""
+Single-flight coalescing of duplicate in-flight work.
+
+When many requests ask for the same symbol at the same moment (market
+open, a popular watchlist), only the first one - the leader - starts the
+prediction; the others await the leader's result instead of running
+their own pipeline.  Keys include the symbol's data version, so a request
+that arrives after a new bar landed never joins a computation on stale
+data.
+
+Coalescing happens on the event loop, before the prediction executor, so
+followers take neither a worker nor a queue slot.
+"""
+import asyncio
+
+
+class SingleFlight:
+    """Share one running computation between concurrent callers per key"""
+
+    def __init__(self, name="single_flight"):
+        self.name = name
+        self._calls = {}
+
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def run(self, key, fn):
+        """Await ``fn()`` (a coroutine function), or join the call already
+        running for ``key``.
+
+        Every caller gets the leader's result or exception.  A caller that
+        is cancelled (e.g. the client disconnected) stops waiting without
+        cancelling the shared computation.
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+
+        return await asyncio.shield(task)
+
+    def _done(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # mark the exception retrieved even if every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self):
+        total = self.leaders + self.coalesced
+        return {
+            "name": self.name,
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": round(self.coalesced / total, 4) if total else 0.0,
+        }
+
+
+prediction_flight = SingleFlight("predict")
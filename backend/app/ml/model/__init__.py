@@ -1,3 +1,3 @@
-from .lstm_predict import predict_lstm
+from .lstm_predict import predict_lstm, predict_lstm_many
 
-__all__ = ["predict_lstm"]
+__all__ = ["predict_lstm", "predict_lstm_many"]
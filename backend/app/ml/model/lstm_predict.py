@@ -2,7 +2,12 @@ import numpy as np
 import pandas as pd
 from sklearn.preprocessing import MinMaxScaler
 from pathlib import Path
+import os
 import pickle
+import threading
+
+from .numpy_lstm import NumpyLSTMModel, export_weights
+from ...utils.logger import logger
 
 # Lazy import tensorflow - will only load when actually needed
 tf = None
@@ -10,18 +15,46 @@ tf = None
 
 REPO_ROOT = Path(__file__).resolve().parents[4]
 MODEL_PATH = REPO_ROOT / "models" / "lstm" / "lstm_trend_model.keras"
+WEIGHTS_PATH = MODEL_PATH.with_suffix(".npz")
 SCALER_PATH = REPO_ROOT / "models" / "scaler.pkl"
 SEQUENCE_LENGTH = 60
 
+# "numpy" (default) serves exported weights without TensorFlow; missing or
+# stale weights are exported from the Keras model on first load (the only
+# time TensorFlow is imported).  "keras" always serves the Keras model.
+LSTM_BACKEND = os.environ.get("LSTM_BACKEND", "numpy")
+
 # Lazy-load model/scaler to avoid startup cost
 _model = None
+_model_version = None
+_model_files = None
 _scaler = None
+_model_lock = threading.Lock()
 
 
-def _load_model():
-    """Load LSTM model from disk (lazy loading)"""
-    global _model, tf
-    
+def _weights_current():
+    """True if exported NumPy weights exist and are not older than the model"""
+    if not WEIGHTS_PATH.exists():
+        return False
+    return not MODEL_PATH.exists() or WEIGHTS_PATH.stat().st_mtime >= MODEL_PATH.stat().st_mtime
+
+
+def _files_signature():
+    """mtime and size of the model, exported weights and scaler files"""
+    signature = []
+    for path in (MODEL_PATH, WEIGHTS_PATH, SCALER_PATH):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _load_keras_model():
+    global tf
+
     # Lazy import tensorflow only when needed
     if tf is None:
         try:
@@ -29,16 +62,75 @@ def _load_model():
         except ImportError:
             # TensorFlow not available, return None
             return None
-            
+
+    if not MODEL_PATH.exists():
+        # Return None if model doesn't exist yet
+        return None
+
+    return tf.keras.models.load_model(str(MODEL_PATH))
+
+
+def _load_model():
+    """Load LSTM model from disk (lazy loading)"""
+    global _model, _model_version, _model_files
+
     if _model is None:
-        if MODEL_PATH.exists():
-            _model = tf.keras.models.load_model(str(MODEL_PATH))
-        else:
-            # Return None if model doesn't exist yet
-            return None
+        # the warmup thread and a live request may race to load
+        with _model_lock:
+            if _model is None:
+                if LSTM_BACKEND != "keras" and _weights_current():
+                    path, _model = WEIGHTS_PATH, NumpyLSTMModel.load(WEIGHTS_PATH)
+                else:
+                    path, _model = MODEL_PATH, _load_keras_model()
+                    if _model is not None and LSTM_BACKEND != "keras":
+                        path, _model = _export_served_model(_model)
+                if _model is not None:
+                    # after any export, so the new weights file is included
+                    _model_files = _files_signature()
+                    _model_version = (path.name,) + _model_files
     return _model
 
 
+def _export_served_model(keras_model):
+    """Export ``keras_model`` to ``WEIGHTS_PATH`` and serve the NumPy copy.
+
+    Falls back to the Keras model if the export fails.
+    """
+    try:
+        export_weights(keras_model, WEIGHTS_PATH)
+        logger.info(f"Exported LSTM weights to {WEIGHTS_PATH}")
+        return WEIGHTS_PATH, NumpyLSTMModel.load(WEIGHTS_PATH)
+    except Exception as exc:
+        logger.error(f"Exporting LSTM weights failed, serving the Keras model: {exc}")
+        return MODEL_PATH, keras_model
+
+
+def model_version():
+    """Identity of the model predictions come from (``None`` if no model).
+
+    Checks the model, weights and scaler files on every call and reloads
+    them when any changed on disk, so a retrained or re-exported model is
+    picked up (and cached results scored with the old one become misses)
+    without restarting the server.
+    """
+    if _model is not None and _files_signature() != _model_files:
+        logger.info("LSTM model files changed on disk, reloading")
+        reload_model()
+    _load_model()
+    return _model_version
+
+
+def reload_model():
+    """Drop the loaded model and scaler; the next prediction reloads them"""
+    global _model, _model_version, _model_files, _scaler
+
+    with _model_lock:
+        _model = None
+        _model_version = None
+        _model_files = None
+        _scaler = None
+
+
 def _load_scaler():
     """Load preprocessing scaler from disk (pickle)"""
     global _scaler
@@ -52,30 +144,43 @@ def _load_scaler():
     return _scaler
 
 
-def predict_lstm(df):
-    """Predict trend probability using LSTM model"""
+FEATURE_COLS = ["Open", "High", "Low", "Close", "Volume"]
+
+# sequences per forward pass in predict_lstm_many
+BATCH_SIZE = 256
+
+
+def _last_sequence(df, scaler):
+    """Scaled last ``SEQUENCE_LENGTH`` bars of ``df`` (``None`` if too short)"""
 
-    for col in ["Open", "High", "Low", "Close", "Volume"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    # work on a numeric copy; ``df`` may be a shared cached frame
+    df = df[FEATURE_COLS].apply(pd.to_numeric, errors="coerce")
 
     df = df.dropna()
 
     if len(df) < SEQUENCE_LENGTH:
-        return 0.5  # Neutral probability if insufficient data
+        return None
 
-    features = df[["Open", "High", "Low", "Close", "Volume"]].values
+    features = df.values
 
-    # attempt to reuse the scaler that was saved during training
-    scaler = _load_scaler()
     if scaler is None:
         # fall back to fresh scaler - this will not match training distribution
-        scaler = MinMaxScaler()
-        features = scaler.fit_transform(features)
-    else:
-        # apply the pre‑fitted transformation (do NOT re-fit)
-        features = scaler.transform(features)
+        return MinMaxScaler().fit_transform(features)[-SEQUENCE_LENGTH:]
+
+    # apply the pre‑fitted transformation (do NOT re-fit); it is per-row,
+    # so only the window itself needs transforming
+    return scaler.transform(features[-SEQUENCE_LENGTH:])
+
+
+def predict_lstm(df):
+    """Predict trend probability using LSTM model"""
+
+    # attempt to reuse the scaler that was saved during training
+    last_sequence = _last_sequence(df, _load_scaler())
+
+    if last_sequence is None:
+        return 0.5  # Neutral probability if insufficient data
 
-    last_sequence = features[-SEQUENCE_LENGTH:]
     last_sequence = np.expand_dims(last_sequence, axis=0)
 
     model = _load_model()
@@ -86,3 +191,43 @@ def predict_lstm(df):
 
     # ensure a python float between 0 and 1
     return float(np.clip(prob, 0.0, 1.0))
+
+
+def predict_lstm_many(frames, batch_size=BATCH_SIZE):
+    """Predict trend probabilities for many symbols in one forward pass.
+
+    Args:
+        frames: dict mapping symbol to an OHLCV DataFrame
+        batch_size: maximum sequences per forward pass
+
+    Returns:
+        dict mapping symbol to probability, in ``frames`` order; symbols
+        with fewer than ``SEQUENCE_LENGTH`` clean bars (or every symbol,
+        if the model is unavailable) get the neutral 0.5
+    """
+    probs = dict.fromkeys(frames, 0.5)
+
+    scaler = _load_scaler()
+    sequences = {}
+    for symbol, df in frames.items():
+        seq = _last_sequence(df, scaler)
+        if seq is not None:
+            sequences[symbol] = seq
+
+    if not sequences:
+        return probs
+
+    model = _load_model()
+    if model is None:
+        return probs
+
+    batch = np.stack(list(sequences.values())).astype(np.float32)
+    out = np.concatenate([
+        np.asarray(model.predict_on_batch(batch[i:i + batch_size])).reshape(-1)
+        for i in range(0, len(batch), batch_size)
+    ])
+
+    for symbol, prob in zip(sequences, np.clip(out, 0.0, 1.0)):
+        probs[symbol] = float(prob)
+
+    return probs
@@ -0,0 +1,175 @@
+"""
+TensorFlow-free inference for the Keras LSTM models.
+
+``export_weights`` dumps a trained ``Sequential`` model built from
+``LSTM``, ``Dense`` and ``Dropout`` layers to a compact ``.npz`` file (layer
+config as JSON plus one array per weight).  ``NumpyLSTMModel`` loads that
+file and reproduces the Keras forward pass with NumPy, so the API process
+can score sequences without importing TensorFlow.
+
+The input projection of each LSTM layer is computed for every timestep in
+one matrix product; only the recurrent update loops over time, and every
+step is vectorized across the batch.
+
+Export an existing model (needs TensorFlow, run from ``backend``)::
+
+    python -m app.ml.model.numpy_lstm ../models/lstm/lstm_trend_model.keras
+"""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+def _sigmoid(x):
+    return 0.5 * (np.tanh(0.5 * x) + 1.0)
+
+
+def _hard_sigmoid(x):
+    # Keras 3 definition: relu6(x + 3) / 6
+    return np.clip((x + 3.0) / 6.0, 0.0, 1.0)
+
+
+ACTIVATIONS = {
+    "linear": lambda x: x,
+    "sigmoid": _sigmoid,
+    "hard_sigmoid": _hard_sigmoid,
+    "tanh": np.tanh,
+    "relu": lambda x: np.maximum(x, 0.0),
+}
+
+
+def export_weights(model, path):
+    """Write the weights of a Keras ``Sequential`` LSTM model to ``path`` (.npz)"""
+    layers = []
+    arrays = {}
+
+    for layer in model.layers:
+        kind = type(layer).__name__
+        config = layer.get_config()
+
+        if kind == "Dropout":
+            continue  # identity at inference
+
+        if kind == "LSTM":
+            spec = {
+                "kind": kind,
+                "units": config["units"],
+                "activation": config["activation"],
+                "recurrent_activation": config["recurrent_activation"],
+                "return_sequences": config["return_sequences"],
+                "use_bias": config["use_bias"],
+            }
+            names = ["kernel", "recurrent_kernel", "bias"]
+        elif kind == "Dense":
+            spec = {
+                "kind": kind,
+                "units": config["units"],
+                "activation": config["activation"],
+                "use_bias": config["use_bias"],
+            }
+            names = ["kernel", "bias"]
+        else:
+            raise ValueError(f"unsupported layer for NumPy export: {kind}")
+
+        for activation in (spec["activation"], spec.get("recurrent_activation", "linear")):
+            if activation not in ACTIVATIONS:
+                raise ValueError(f"unsupported activation for NumPy export: {activation}")
+
+        for name, weight in zip(names, layer.get_weights()):
+            arrays[f"{len(layers)}_{name}"] = np.asarray(weight, dtype=np.float32)
+
+        layers.append(spec)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(path, config=np.array(json.dumps(layers)), **arrays)
+
+    return path
+
+
+class NumpyLSTMModel:
+    """Keras-compatible ``predict`` over exported LSTM/Dense weights"""
+
+    def __init__(self, layers, weights):
+        self.layers = layers
+        self.weights = weights
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            layers = json.loads(str(data["config"]))
+            weights = {key: data[key] for key in data.files if key != "config"}
+        return cls(layers, weights)
+
+    def _lstm(self, i, spec, x):
+        w = self.weights
+        units = spec["units"]
+        act = ACTIVATIONS[spec["activation"]]
+        rec_act = ACTIVATIONS[spec["recurrent_activation"]]
+
+        batch, steps, _ = x.shape
+
+        # input contribution for all timesteps at once: (batch, steps, 4 * units)
+        z_in = x @ w[f"{i}_kernel"]
+        if spec["use_bias"]:
+            z_in += w[f"{i}_bias"]
+        recurrent = w[f"{i}_recurrent_kernel"]
+
+        h = np.zeros((batch, units), dtype=x.dtype)
+        c = np.zeros((batch, units), dtype=x.dtype)
+        outputs = np.empty((batch, steps, units), dtype=x.dtype) if spec["return_sequences"] else None
+
+        for t in range(steps):
+            z = z_in[:, t] + h @ recurrent
+
+            # Keras gate order: input, forget, cell, output
+            gate_i = rec_act(z[:, :units])
+            gate_f = rec_act(z[:, units:2 * units])
+            gate_c = act(z[:, 2 * units:3 * units])
+            gate_o = rec_act(z[:, 3 * units:])
+
+            c = gate_f * c + gate_i * gate_c
+            h = gate_o * act(c)
+
+            if outputs is not None:
+                outputs[:, t] = h
+
+        return outputs if outputs is not None else h
+
+    def _dense(self, i, spec, x):
+        y = x @ self.weights[f"{i}_kernel"]
+        if spec["use_bias"]:
+            y += self.weights[f"{i}_bias"]
+        return ACTIVATIONS[spec["activation"]](y)
+
+    def predict_on_batch(self, x):
+        """Forward pass for a ``(batch, steps, features)`` array"""
+        x = np.asarray(x, dtype=np.float32)
+
+        for i, spec in enumerate(self.layers):
+            if spec["kind"] == "LSTM":
+                x = self._lstm(i, spec, x)
+            else:
+                x = self._dense(i, spec, x)
+
+        return x
+
+    def predict(self, x, verbose=0, batch_size=None):
+        """Same as ``predict_on_batch``; mirrors the Keras signature"""
+        return self.predict_on_batch(x)
+
+
+def main():
+    import tensorflow as tf
+
+    for model_path in sys.argv[1:]:
+        model_path = Path(model_path)
+        model = tf.keras.models.load_model(str(model_path))
+        out = export_weights(model, model_path.with_suffix(".npz"))
+        print(f"Exported {model_path} -> {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 # Scoring engine package
 __all__ = [
     "calculate_final_score",
+    "final_scores",
+    "score_frame",
     "technical_score",
     "trend_score",
     "risk_score",
     "sentiment_score",
     "pattern_score",
+    "codes",
 ]
@@ -0,0 +1,76 @@
+"""
+Compact explanation codes for the vectorized scorers.
+
+The array scorers (``technical_scores``, ``trend_scores``, ...) return one
+integer per row instead of a list of strings: bit ``i`` is set when
+``REASONS[i]`` applies.  Bits are ordered the way the scalar scorers list
+their explanations (technical, trend, risk, then sentiment and pattern),
+so decoding a code gives exactly the list the scalar functions would
+build.
+"""
+import numpy as np
+
+
+REASONS = (
+    # technical_score
+    "RSI indicates oversold (bullish)",
+    "RSI indicates overbought (bearish)",
+    "EMA20 above EMA50 (uptrend)",
+    "EMA20 below EMA50 (downtrend)",
+    "MACD positive (momentum bullish)",
+    "MACD negative",
+    # trend_score
+    "Trend slope positive",
+    "Trend slope negative",
+    "20-day momentum positive",
+    # risk_score
+    "Low volatility (stable)",
+    "High volatility risk",
+    # sentiment_score
+    "Strong volume (bullish sentiment)",
+    "Weak volume (bearish sentiment)",
+    "Low volatility (stable sentiment)",
+    "High volatility (uncertain sentiment)",
+    "Oversold extreme (bearish reversal risk)",
+    "Underbought extreme (bullish reversal potential)",
+    "Neutral sentiment",
+    # pattern_score
+    "Hammer pattern (potential reversal)",
+    "Shooting star (potential reversal)",
+    "Bullish engulfing pattern",
+    "Bearish engulfing pattern",
+    "Doji pattern (indecision)",
+    "Morning star (bullish reversal)",
+    "Evening star (bearish reversal)",
+    "Three white soldiers (strong uptrend)",
+    "Three black crows (strong downtrend)",
+    "No significant patterns detected",
+)
+
+CODE_DTYPE = np.uint32
+
+_BITS = {text: CODE_DTYPE(1 << i) for i, text in enumerate(REASONS)}
+
+
+def bit(text):
+    """The code bit for an explanation string"""
+    return _BITS[text]
+
+
+def flag(cond, text):
+    """``bit(text)`` where ``cond`` holds, else 0"""
+    return np.where(cond, bit(text), CODE_DTYPE(0))
+
+
+def explain(code):
+    """Decode one code into its list of explanation strings"""
+    code = int(code)
+    return [text for i, text in enumerate(REASONS) if code >> i & 1]
+
+
+def explain_many(codes):
+    """Decode an array of codes; each distinct code is decoded once"""
+    codes = np.asarray(codes)
+    unique, inverse = np.unique(codes, return_inverse=True)
+    decoded = [explain(code) for code in unique]
+    return [list(decoded[i]) for i in inverse.ravel()]
@@ -1,6 +1,17 @@
-from .technical_score import technical_score
-from .trend_score import trend_score
-from .risk_score import risk_score
+import numpy as np
+import pandas as pd
+
+from .codes import explain_many
+from .technical_score import technical_score, technical_scores
+from .trend_score import trend_score, trend_scores
+from .risk_score import risk_score, risk_scores
+from .sentiment_score import sentiment_scores
+
+
+# bump whenever a scoring rule, threshold or weight changes (including the
+# technical/LSTM blend in inference.predict), so cached predictions scored
+# with the old rules are not served
+SCORING_VERSION = 1
 
 
 def calculate_final_score(latest):
@@ -26,3 +37,66 @@ def calculate_final_score(latest):
         decision = "Avoid"
 
     return final, decision, explanation
+
+
+def final_decisions(final):
+    """Decision strings for an array of final scores"""
+    return np.select(
+        [final >= 75, final >= 60, final >= 45],
+        ["Strong Buy", "Buy", "Hold"],
+        default="Avoid",
+    )
+
+
+def final_scores(features):
+    """Vectorized ``calculate_final_score`` over every row of ``features``.
+
+    ``features`` maps column names to equally shaped arrays: a featurized
+    DataFrame (one row per bar) or a panel dict of dates x symbols frames,
+    so a whole universe's history is scored in a handful of array
+    operations.  Returns ``(final, codes)`` arrays of that shape; decode
+    codes with ``codes.explain``.
+    """
+    tech, tech_codes = technical_scores(features)
+    trend, trend_codes = trend_scores(features)
+    risk, risk_codes = risk_scores(features)
+
+    final = np.clip(50 + tech + trend + risk, 0, 100).astype(float)
+
+    return final, tech_codes | trend_codes | risk_codes
+
+
+def calculate_final_scores(rows):
+    """Vectorized ``calculate_final_score`` over a DataFrame of feature rows.
+
+    Returns ``(final, decision, explanation)``: a float array, an array of
+    decision strings and a list of explanation lists, one entry per row,
+    each equal to what ``calculate_final_score`` gives for that row.
+    """
+    final, codes = final_scores(rows)
+    return final, final_decisions(final), explain_many(codes)
+
+
+def score_frame(df):
+    """Per-row score columns for a featurized frame (``build_features``).
+
+    Returns a DataFrame on ``df``'s index with each component score, the
+    sentiment score (not part of the final score, as in
+    ``calculate_final_score``), ``final_score``, ``decision`` and the
+    compact explanation ``code`` of the final score.
+    """
+    tech, _ = technical_scores(df)
+    trend, _ = trend_scores(df)
+    risk, _ = risk_scores(df)
+    sentiment, _ = sentiment_scores(df)
+    final, codes = final_scores(df)
+
+    return pd.DataFrame({
+        "technical_score": tech,
+        "trend_score": trend,
+        "risk_score": risk,
+        "sentiment_score": sentiment,
+        "final_score": final,
+        "decision": final_decisions(final),
+        "code": codes,
+    }, index=df.index)
@@ -2,76 +2,72 @@
 Candlestick pattern recognition scoring.
 Identifies bullish/bearish patterns from recent price action.
 """
+import numpy as np
 
+from ..indicators.patterns import PATTERNS, detect_patterns
+from .codes import CODE_DTYPE, flag
 
-def pattern_score(df):
-    """
-    Analyze candlestick patterns from the last few periods.
-    
-    Returns:
-        tuple: (score: int, explanation: list)
-        Score range: -25 to +25
-    """
-    score = 0
-    explanation = []
-
-    if len(df) < 3:
-        explanation.append("Insufficient data for pattern analysis")
-        return score, explanation
 
-    # Extract recent candles (last 3)
-    recent = df.tail(3).reset_index(drop=True)
+# pattern -> (points, explanation), in explanation order
+PATTERN_RULES = {
+    "hammer": (20, "Hammer pattern (potential reversal)"),
+    "shooting_star": (-20, "Shooting star (potential reversal)"),
+    "bullish_engulfing": (15, "Bullish engulfing pattern"),
+    "bearish_engulfing": (-15, "Bearish engulfing pattern"),
+    "doji": (10, "Doji pattern (indecision)"),
+    "morning_star": (15, "Morning star (bullish reversal)"),
+    "evening_star": (-15, "Evening star (bearish reversal)"),
+    "three_white_soldiers": (20, "Three white soldiers (strong uptrend)"),
+    "three_black_crows": (-20, "Three black crows (strong downtrend)"),
+}
 
-    # Current (most recent) candle
-    current = recent.iloc[-1]
-    prev_close = recent.iloc[-2]["Close"]
+MAX_PATTERN_SCORE = 25
 
-    body = current["Close"] - current["Open"]
-    body_height = abs(body)
-    total_range = current["High"] - current["Low"]
 
-    # Normalize body relative to total range
-    body_ratio = body_height / total_range if total_range > 0 else 0
+def pattern_scores(ohlc):
+    """Vectorized pattern scoring for every bar.
 
-    # Hammer pattern (small body, long lower wick)
-    if total_range > 0:
-        lower_wick = current["Open"] - current["Low"] if current["Open"] < current["Close"] else current["Close"] - current["Low"]
-        lower_wick_ratio = lower_wick / total_range if total_range > 0 else 0
+    ``ohlc`` maps Open/High/Low/Close to equally shaped arrays.  Returns
+    ``(scores, codes)`` arrays of that shape, scores clipped to
+    +/-``MAX_PATTERN_SCORE``; see ``codes.explain``.
+    """
+    flags = detect_patterns(ohlc)
 
-        if lower_wick_ratio > 0.6 and body_ratio < 0.3 and current["Close"] > prev_close:
-            score += 20
-            explanation.append("Hammer pattern (potential reversal)")
+    score = np.zeros(flags["doji"].shape, dtype=int)
+    code = np.zeros(flags["doji"].shape, dtype=CODE_DTYPE)
+    for name in PATTERNS:
+        points, text = PATTERN_RULES[name]
+        score += np.where(flags[name], points, 0)
+        code |= flag(flags[name], text)
 
-    # Engulfing pattern (current candle engulfs previous)
-    if len(recent) >= 2:
-        prev = recent.iloc[-2]
-        prev_body = abs(prev["Close"] - prev["Open"])
+    code |= flag(code == 0, "No significant patterns detected")
+    return np.clip(score, -MAX_PATTERN_SCORE, MAX_PATTERN_SCORE), code
 
-        if body > 1.3 * prev_body and current["Close"] > prev["Open"]:
-            score += 15
-            explanation.append("Bullish engulfing pattern")
-        elif body < -1.3 * prev_body and current["Close"] < prev["Open"]:
-            score -= 15
-            explanation.append("Bearish engulfing pattern")
 
-    # Doji-like pattern (small body, balanced wicks)
-    if body_ratio < 0.15:
-        upper_wick = current["High"] - max(current["Open"], current["Close"])
-        lower_wick = min(current["Open"], current["Close"]) - current["Low"]
+def pattern_score(df):
+    """
+    Analyze candlestick patterns on the most recent candle.
+    
+    Returns:
+        tuple: (score: int, explanation: list)
+        Score range: -25 to +25
+    """
+    if len(df) < 3:
+        return 0, ["Insufficient data for pattern analysis"]
 
-        if abs(upper_wick - lower_wick) < 0.005 * current["Close"]:
-            score += 10
-            explanation.append("Doji pattern (indecision)")
+    # the longest patterns span three candles
+    recent = df.tail(3)
+    flags = detect_patterns(recent)
 
-    # Three white soldiers / three black crows
-    if len(recent) >= 3:
-        all_bullish = all(recent[i]["Close"] > recent[i]["Open"] for i in range(3))
-        if all_bullish:
-            if recent.iloc[2]["Close"] > recent.iloc[1]["Close"] > recent.iloc[0]["Close"]:
-                score += 20
-                explanation.append("Three white soldiers (strong uptrend)")
+    score = 0
+    explanation = []
+    for name in PATTERNS:
+        if flags[name][-1]:
+            points, text = PATTERN_RULES[name]
+            score += points
+            explanation.append(text)
 
-    if not explanation or (score == 0 and not explanation):
+    if not explanation:
         explanation.append("No significant patterns detected")
 
-    return score, explanation
+    return max(-MAX_PATTERN_SCORE, min(MAX_PATTERN_SCORE, score)), explanation
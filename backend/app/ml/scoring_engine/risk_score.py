@@ -1,3 +1,8 @@
+import numpy as np
+
+from .codes import flag
+
+
 def risk_score(latest):
 
     score = 0
@@ -11,3 +16,15 @@ def risk_score(latest):
         explanation.append("High volatility risk")
 
     return score, explanation
+
+
+def risk_scores(features):
+    """Vectorized ``risk_score``; returns ``(scores, codes)`` arrays"""
+    atr = np.asarray(features["atr"], dtype=float)
+    close = np.asarray(features["Close"], dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stable = atr / close < 0.03
+
+    score = np.where(stable, 10, -5)
+    code = flag(stable, "Low volatility (stable)") | flag(~stable, "High volatility risk")
+    return score, code
@@ -2,6 +2,9 @@
 Sentiment and market condition scoring.
 Evaluates overall market sentiment from price action and volatility.
 """
+import numpy as np
+
+from .codes import CODE_DTYPE, flag
 
 
 def sentiment_score(latest):
@@ -50,3 +53,38 @@ def sentiment_score(latest):
         explanation.append("Neutral sentiment")
 
     return score, explanation
+
+
+def sentiment_scores(features):
+    """Vectorized ``sentiment_score``; returns ``(scores, codes)`` arrays.
+
+    As in the scalar version, a rule only applies when ``features`` has
+    its column.
+    """
+    shape = np.shape(features["Close"])
+    score = np.zeros(shape, dtype=int)
+    code = np.zeros(shape, dtype=CODE_DTYPE)
+
+    if "volume_ma_ratio" in features:
+        ratio = np.asarray(features["volume_ma_ratio"], dtype=float)
+        strong, weak = ratio > 1.3, ratio < 0.7
+        score += np.select([strong, weak], [10, -8], default=0)
+        code |= flag(strong, "Strong volume (bullish sentiment)")
+        code |= flag(~strong & weak, "Weak volume (bearish sentiment)")
+
+    if "volatility" in features:
+        vol = np.asarray(features["volatility"], dtype=float)
+        low, high = vol < 0.015, vol > 0.04
+        score += np.select([low, high], [5, -5], default=0)
+        code |= flag(low, "Low volatility (stable sentiment)")
+        code |= flag(~low & high, "High volatility (uncertain sentiment)")
+
+    if "rsi" in features:
+        rsi = np.asarray(features["rsi"], dtype=float)
+        hot, cold = rsi > 80, rsi < 20
+        score += np.select([hot, cold], [-8, 8], default=0)
+        code |= flag(hot, "Oversold extreme (bearish reversal risk)")
+        code |= flag(~hot & cold, "Underbought extreme (bullish reversal potential)")
+
+    code |= flag(code == 0, "Neutral sentiment")
+    return score, code
@@ -1,3 +1,8 @@
+import numpy as np
+
+from .codes import flag
+
+
 def technical_score(latest):
 
     score = 0
@@ -30,3 +35,32 @@ def technical_score(latest):
         explanation.append("MACD negative")
 
     return score, explanation
+
+
+def technical_scores(features):
+    """Vectorized ``technical_score`` over every row of ``features``.
+
+    ``features`` maps column names to equally shaped arrays (a featurized
+    DataFrame, or a panel dict of dates x symbols frames).  Returns
+    ``(scores, codes)`` arrays of that shape; see ``codes.explain``.
+    """
+    rsi = np.asarray(features["rsi"], dtype=float)
+    oversold = rsi < 30
+    overbought = ~oversold & (rsi > 70)
+    ema_up = np.asarray(features["ema_diff"], dtype=float) > 0
+    macd_up = np.asarray(features["macd"], dtype=float) > 0
+
+    score = (
+        np.select([oversold, overbought], [20, -15], default=5)
+        + np.where(ema_up, 20, -10)
+        + np.where(macd_up, 15, -10)
+    )
+    code = (
+        flag(oversold, "RSI indicates oversold (bullish)")
+        | flag(overbought, "RSI indicates overbought (bearish)")
+        | flag(ema_up, "EMA20 above EMA50 (uptrend)")
+        | flag(~ema_up, "EMA20 below EMA50 (downtrend)")
+        | flag(macd_up, "MACD positive (momentum bullish)")
+        | flag(~macd_up, "MACD negative")
+    )
+    return score, code
@@ -1,3 +1,8 @@
+import numpy as np
+
+from .codes import flag
+
+
 def trend_score(latest):
 
     score = 0
@@ -15,3 +20,17 @@ def trend_score(latest):
         explanation.append("20-day momentum positive")
 
     return score, explanation
+
+
+def trend_scores(features):
+    """Vectorized ``trend_score``; returns ``(scores, codes)`` arrays"""
+    slope_up = np.asarray(features["trend_slope"], dtype=float) > 0
+    momentum_up = np.asarray(features["momentum_20"], dtype=float) > 0
+
+    score = np.where(slope_up, 20, -10) + np.where(momentum_up, 15, 0)
+    code = (
+        flag(slope_up, "Trend slope positive")
+        | flag(~slope_up, "Trend slope negative")
+        | flag(momentum_up, "20-day momentum positive")
+    )
+    return score, code
@@ -1,6 +1,9 @@
 """Training scripts and model utilities."""
 
-from .train_cnn import train as train_cnn
-from .train_lstm_7day import train as train_lstm_7day
-from .train_lstm_30day import train as train_lstm_30day
-from .train_lstm_trend import train as train_lstm_trend
\ No newline at end of file
+__all__ = [
+    "train_cnn",
+    "train_horizons",
+    "train_lstm",
+    "train_next_7day",
+    "train_next_30day",
+]
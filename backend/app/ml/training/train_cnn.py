@@ -1,87 +1,118 @@
+"""
+CNN chart-pattern training.
+
+Reads labeled chart shards produced by
+``app.ml.data_pipeline.chart_dataset`` (rendering them first if they do
+not exist yet) and streams batches from the memory-mapped shards instead
+of decoding PNGs from disk every epoch.
+
+Usage (from the ``backend`` directory)::
+
+    python -m app.ml.training.train_cnn --epochs 10
+"""
+import argparse
 import os
 
+from ..data_pipeline.chart_dataset import (
+    CHART_SHARD_DIR,
+    INDEX_FILE,
+    generate_chart_dataset,
+    load_chart_dataset,
+)
+from ..data_pipeline.generate_charts import CHART_SIZE
+
 # project root directory
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
 
-from tensorflow.keras.preprocessing.image import ImageDataGenerator
-from tensorflow.keras.models import Sequential
-from tensorflow.keras.layers import Conv2D, MaxPooling2D, Flatten, Dense, Dropout, Input
-
-DATA_DIR = os.path.join(BASE_DIR, "data/charts/training")
 MODEL_PATH = os.path.join(BASE_DIR, "models/cnn/cnn_pattern.keras")
 
-os.makedirs(os.path.join(BASE_DIR, "models/cnn"), exist_ok=True)
-
-IMG_SIZE = (128, 128)
+IMG_SIZE = CHART_SIZE
 BATCH = 32
 
 
-print("Loading chart images...")
+def build_model(input_shape=IMG_SIZE + (3,)):
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.layers import Conv2D, MaxPooling2D, Flatten, Dense, Dropout, Input
 
-datagen = ImageDataGenerator(
-    rescale=1./255,
-    validation_split=0.2
-)
+    model = Sequential([
 
-train = datagen.flow_from_directory(
-    DATA_DIR,
-    target_size=IMG_SIZE,
-    batch_size=BATCH,
-    class_mode="binary",
-    subset="training"
-)
+        Input(shape=input_shape),
 
-val = datagen.flow_from_directory(
-    DATA_DIR,
-    target_size=IMG_SIZE,
-    batch_size=BATCH,
-    class_mode="binary",
-    subset="validation"
-)
+        Conv2D(32,(3,3),activation="relu"),
+        MaxPooling2D(),
 
+        Conv2D(64,(3,3),activation="relu"),
+        MaxPooling2D(),
 
-print("\nBuilding CNN model...")
+        Conv2D(128,(3,3),activation="relu"),
+        MaxPooling2D(),
 
-model = Sequential([
+        Flatten(),
 
-    Input(shape=(128,128,3)),
+        Dense(128,activation="relu"),
+        Dropout(0.4),
 
-    Conv2D(32,(3,3),activation="relu"),
-    MaxPooling2D(),
+        Dense(1,activation="sigmoid")
 
-    Conv2D(64,(3,3),activation="relu"),
-    MaxPooling2D(),
+    ])
 
-    Conv2D(128,(3,3),activation="relu"),
-    MaxPooling2D(),
+    model.compile(
+        optimizer="adam",
+        loss="binary_crossentropy",
+        metrics=["accuracy"]
+    )
 
-    Flatten(),
+    return model
 
-    Dense(128,activation="relu"),
-    Dropout(0.4),
 
-    Dense(1,activation="sigmoid")
+def train(shard_dir=CHART_SHARD_DIR, epochs=10, batch_size=BATCH, validation_split=0.2,
+          regenerate=False, workers=None):
+    """Train and save the chart CNN from chart shards"""
 
-])
+    if regenerate or not os.path.exists(os.path.join(shard_dir, INDEX_FILE)):
+        print("Rendering chart shards...")
+        generate_chart_dataset(shard_dir=shard_dir, size=IMG_SIZE, workers=workers)
 
+    print("Loading chart shards...")
 
-model.compile(
-    optimizer="adam",
-    loss="binary_crossentropy",
-    metrics=["accuracy"]
-)
+    dataset = load_chart_dataset(shard_dir, batch_size=batch_size)
+    train_set, val_set = dataset.split(validation_split)
 
+    print("Charts:", dataset.num_samples, "Shape:", dataset.input_shape)
 
-print("\nTraining CNN...")
+    print("\nBuilding CNN model...")
 
-model.fit(
-    train,
-    validation_data=val,
-    epochs=10
-)
+    model = build_model(dataset.input_shape)
+
+    print("\nTraining CNN...")
+
+    model.fit(
+        train_set.to_keras(),
+        validation_data=val_set.to_keras(),
+        epochs=epochs
+    )
+
+    os.makedirs(os.path.dirname(MODEL_PATH), exist_ok=True)
+    model.save(MODEL_PATH)
+
+    print("\n✅ CNN model saved at:")
+    print(MODEL_PATH)
+
+    return MODEL_PATH
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the chart-pattern CNN")
+    parser.add_argument("--epochs", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=BATCH)
+    parser.add_argument("--regenerate", action="store_true",
+                        help="re-render chart shards even if they exist")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
 
+    train(epochs=args.epochs, batch_size=args.batch_size,
+          regenerate=args.regenerate, workers=args.workers)
 
-model.save(MODEL_PATH)
 
-print("\n✅ CNN model saved at:")
-print(MODEL_PATH)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Unified multi-horizon LSTM training.
+
+Featurizes and scales every symbol once, derives the forward-return
+targets for all requested horizons in one vectorized pass, and then
+trains one model per horizon from the shared on-disk training set,
+optionally in parallel worker processes.
+
+Usage (from the ``backend`` directory)::
+
+    python -m app.ml.training.train_horizons --horizons 7 30 --workers 2
+"""
+import argparse
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing as mp
+from pathlib import Path
+
+import numpy as np
+
+from ..data_pipeline.price_store import PRICES_DIR, REPO_ROOT, load_prices
+from ..data_pipeline.training_shards import load_training_shards, write_training_shards
+from ..indicators.indicators import compute_ema, compute_rsi
+from ..model.numpy_lstm import export_weights
+
+
+MODEL_DIR = REPO_ROOT / "models" / "lstm"
+SCALER_DIR = REPO_ROOT / "models" / "scaler"
+SHARD_DIR = REPO_ROOT / "data" / "shards" / "horizons"
+
+SEQUENCE = 60
+
+FEATURE_COLS = ["Close", "Volume", "RSI", "EMA12", "EMA26"]
+
+
+def model_path(horizon):
+    return MODEL_DIR / f"model_{horizon}day.keras"
+
+
+def scaler_path(horizon):
+    return SCALER_DIR / f"scaler_{horizon}day.pkl"
+
+
+def target_col(horizon):
+    return f"target_{horizon}"
+
+
+def add_targets(df, horizons):
+    """Add ``target_<h>`` forward returns for every horizon at once.
+
+    ``target_h[i] = (Close[i + h] - Close[i]) / Close[i]``; rows without
+    ``h`` future bars get NaN.
+    """
+    close = df["Close"].values
+    n = len(close)
+    horizons = np.asarray(horizons)
+
+    future_idx = np.arange(n)[:, None] + horizons[None, :]   # rows x horizons
+    future = close[np.minimum(future_idx, n - 1)]
+    returns = (future - close[:, None]) / close[:, None]
+    returns[future_idx >= n] = np.nan
+
+    for k, h in enumerate(horizons):
+        df[target_col(h)] = returns[:, k]
+
+    return df
+
+
+def load_data(horizons, data_dir=PRICES_DIR):
+    """Yield ``(symbol, frame)`` with model features and all horizon targets"""
+
+    for csv_path in sorted(Path(data_dir).glob("*.csv")):
+        symbol = csv_path.stem
+
+        print("Loading", symbol)
+
+        df = load_prices(symbol, data_dir)
+
+        df["RSI"] = compute_rsi(df["Close"])
+        df["EMA12"] = compute_ema(df["Close"], 12)
+        df["EMA26"] = compute_ema(df["Close"], 26)
+
+        # drop indicator warm-up rows only; NaN targets are skipped per horizon
+        df = df.dropna(subset=FEATURE_COLS).reset_index(drop=True)
+
+        yield symbol, add_targets(df, horizons)
+
+
+def prepare(horizons, data_dir=PRICES_DIR, shard_dir=SHARD_DIR):
+    """Featurize, scale and shard the universe once for all horizons"""
+
+    print("Scaling...")
+
+    scaler = write_training_shards(
+        load_data(horizons, data_dir), FEATURE_COLS, shard_dir,
+        target_col=[target_col(h) for h in horizons],
+    )
+
+    # every horizon model consumes the same scaled inputs
+    SCALER_DIR.mkdir(parents=True, exist_ok=True)
+    for h in horizons:
+        with open(scaler_path(h), "wb") as f:
+            pickle.dump(scaler, f)
+
+    print("Scaler saved")
+
+    return scaler
+
+
+def build_model(input_shape):
+    from tensorflow.keras.models import Sequential
+    from tensorflow.keras.layers import LSTM, Dense, Dropout, Input
+
+    model = Sequential([
+        Input(shape=input_shape),
+        LSTM(64, return_sequences=True),
+        Dropout(0.2),
+        LSTM(32),
+        Dropout(0.2),
+        Dense(1),
+    ])
+
+    model.compile(
+        optimizer="adam",
+        loss="mse"
+    )
+
+    return model
+
+
+def train_horizon(horizon, shard_dir=SHARD_DIR, epochs=10, batch_size=32):
+    """Train and save the model for one horizon from prepared shards"""
+
+    dataset = load_training_shards(
+        shard_dir, seq_len=SEQUENCE, batch_size=batch_size,
+        target_col=target_col(horizon),
+    )
+
+    print(f"[{horizon}-day] Windows:", dataset.num_samples, "Shape:", dataset.input_shape)
+
+    model = build_model(dataset.input_shape)
+    model.fit(dataset.to_keras(), epochs=epochs)
+
+    MODEL_DIR.mkdir(parents=True, exist_ok=True)
+    model.save(model_path(horizon))
+
+    # TensorFlow-free copy for inference (see model.numpy_lstm)
+    export_weights(model, model_path(horizon).with_suffix(".npz"))
+
+    print(f"\n✅ {horizon}-day model saved at:")
+    print(model_path(horizon))
+
+    return str(model_path(horizon))
+
+
+def train(horizons=(7, 30), epochs=10, batch_size=32, workers=1,
+          data_dir=PRICES_DIR, shard_dir=SHARD_DIR):
+    """Train one LSTM per horizon from a single featurization pass.
+
+    With ``workers > 1`` horizons train concurrently in separate processes
+    that share the memory-mapped training set.
+    """
+    horizons = list(horizons)
+
+    print("Loading data...")
+
+    prepare(horizons, data_dir, shard_dir)
+
+    print("Training...")
+
+    if workers <= 1:
+        return [train_horizon(h, shard_dir, epochs, batch_size) for h in horizons]
+
+    # spawn: TensorFlow is not fork-safe
+    ctx = mp.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = [
+            pool.submit(train_horizon, h, shard_dir, epochs, batch_size)
+            for h in horizons
+        ]
+        return [f.result() for f in futures]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train LSTM models for several horizons")
+    parser.add_argument("--horizons", type=int, nargs="+", default=[7, 30])
+    parser.add_argument("--epochs", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    train(args.horizons, args.epochs, args.batch_size, args.workers)
+
+
+if __name__ == "__main__":
+    main()
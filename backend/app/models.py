@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, Index
 from datetime import datetime
 from .database import Base
 
@@ -28,9 +28,13 @@ class Portfolio(Base):
 class Prediction(Base):
     """Prediction history"""
     __tablename__ = "predictions"
+    # history is read per symbol, newest first (keyset pagination)
+    __table_args__ = (
+        Index("idx_symbol_timestamp", "symbol", "timestamp", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    symbol = Column(String(20), nullable=False, index=True)
+    symbol = Column(String(20), nullable=False)
     decision = Column(String(50), nullable=False)
     score = Column(Float, nullable=False)
     technical_score = Column(Float)
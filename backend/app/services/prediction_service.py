@@ -1,11 +1,34 @@
 """
 Persistence helpers for prediction history.
+
+Served predictions are not written on the request path: routes hand them
+to ``prediction_buffer``, a write-behind buffer whose background thread
+inserts them in bulk every ``PREDICTION_FLUSH_ROWS`` rows or
+``PREDICTION_FLUSH_MS`` milliseconds, whichever comes first.
+
+History is read newest first with keyset pagination on the
+``(symbol, timestamp)`` index: each page ends with a cursor naming its
+last row, and the next page starts strictly after it, so deep pages cost
+the same as the first one.
 """
 
-from typing import List
+import os
+import threading
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import and_, insert, or_
 from sqlalchemy.orm import Session
 
+from ..database import SessionLocal
 from ..models import Prediction
+from ..utils.logger import logger
+
+
+PREDICTION_FLUSH_ROWS = int(os.environ.get("PREDICTION_FLUSH_ROWS", "200"))
+PREDICTION_FLUSH_MS = float(os.environ.get("PREDICTION_FLUSH_MS", "500"))
+# rows held while the database is slow or down; newer rows are dropped beyond this
+PREDICTION_BUFFER_MAX = int(os.environ.get("PREDICTION_BUFFER_MAX", "50000"))
 
 
 def record_prediction(
@@ -27,12 +50,170 @@ def record_prediction(
     return pred
 
 
+def record_predictions(db: Session, rows: List[dict]) -> int:
+    """Insert many ``Prediction`` rows (dicts of column values) in one
+    executemany and commit; returns the row count."""
+    if rows:
+        db.execute(insert(Prediction), rows)
+        db.commit()
+    return len(rows)
+
+
 def get_recent(db: Session, symbol: str, limit: int = 10) -> List[Prediction]:
     """Return the most recent ``limit`` predictions for ``symbol``. """
+    return get_history(db, symbol, limit)
+
+
+def encode_cursor(pred: Prediction) -> str:
+    """Cursor pointing just past ``pred`` in newest-first order"""
+    return f"{pred.timestamp.isoformat()}_{pred.id}"
+
+
+def decode_cursor(cursor: str):
+    """Inverse of ``encode_cursor``; raises ``ValueError`` on bad input"""
+    timestamp, _, pred_id = cursor.rpartition("_")
+    return datetime.fromisoformat(timestamp), int(pred_id)
+
+
+def get_history(
+    db: Session,
+    symbol: str,
+    limit: int = 10,
+    before: Optional[str] = None,
+) -> List[Prediction]:
+    """Return up to ``limit`` predictions for ``symbol``, newest first,
+    starting after the ``before`` cursor when given.
+
+    Rows are ordered by ``(timestamp, id)`` so predictions recorded in the
+    same instant still page deterministically.
+    """
+    query = db.query(Prediction).filter(Prediction.symbol == symbol)
+
+    if before is not None:
+        timestamp, pred_id = decode_cursor(before)
+        query = query.filter(or_(
+            Prediction.timestamp < timestamp,
+            and_(Prediction.timestamp == timestamp, Prediction.id < pred_id),
+        ))
+
     return (
-        db.query(Prediction)
-        .filter(Prediction.symbol == symbol)
-        .order_by(Prediction.timestamp.desc())
+        query.order_by(Prediction.timestamp.desc(), Prediction.id.desc())
         .limit(limit)
         .all()
     )
+
+
+def prediction_row(result: dict) -> dict:
+    """Column values for a ``predict_stock`` result"""
+    return {
+        "symbol": result["symbol"].replace(".NS", ""),
+        "decision": result["decision"],
+        "score": float(result["score"]),
+        "technical_score": float(result["technical_score"]),
+        "lstm_score": float(result["lstm_probability"]),
+        "timestamp": datetime.utcnow(),
+    }
+
+
+class PredictionBuffer:
+    """Write-behind buffer that inserts served predictions in bulk"""
+
+    def __init__(self, session_factory=SessionLocal, flush_rows=PREDICTION_FLUSH_ROWS,
+                 flush_ms=PREDICTION_FLUSH_MS, max_rows=PREDICTION_BUFFER_MAX):
+        self.session_factory = session_factory
+        self.flush_rows = flush_rows
+        self.flush_ms = flush_ms
+        self.max_rows = max_rows
+
+        self._rows = []
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._stop = False
+
+        self.written = 0
+        self.flushes = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def add(self, result):
+        """Queue a prediction result; never touches the database"""
+        row = prediction_row(result)
+        with self._cond:
+            if len(self._rows) >= self.max_rows:
+                self.dropped += 1
+                return
+            self._rows.append(row)
+            if len(self._rows) >= self.flush_rows:
+                self._cond.notify()
+
+    def flush(self):
+        """Write every queued row now; returns the number written"""
+        # one flush at a time, so rows reach the table in arrival order
+        with self._flush_lock:
+            with self._cond:
+                rows, self._rows = self._rows, []
+            if not rows:
+                return 0
+
+            db = self.session_factory()
+            try:
+                record_predictions(db, rows)
+            except Exception as exc:
+                db.rollback()
+                self.failed += len(rows)
+                logger.error(f"Writing {len(rows)} predictions failed: {exc}")
+                return 0
+            finally:
+                db.close()
+
+            self.written += len(rows)
+            self.flushes += 1
+            return len(rows)
+
+    def start(self):
+        """Flush in a background thread until ``stop`` is called"""
+        if self._thread is not None:
+            return
+
+        def run():
+            while True:
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self._stop or len(self._rows) >= self.flush_rows,
+                        timeout=self.flush_ms / 1000,
+                    )
+                    stop = self._stop
+                self.flush()
+                if stop:
+                    return
+
+        self._stop = False
+        self._thread = threading.Thread(target=run, name="prediction-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5):
+        """Stop the background thread after a final flush"""
+        with self._cond:
+            self._stop = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.flush()
+
+    def stats(self):
+        with self._cond:
+            pending = len(self._rows)
+        return {
+            "pending": pending,
+            "flush_rows": self.flush_rows,
+            "flush_ms": self.flush_ms,
+            "written": self.written,
+            "flushes": self.flushes,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+
+prediction_buffer = PredictionBuffer()
@@ -1,2 +1,2 @@
 # Utils package
-__all__ = ["logger", "helpers"]
+__all__ = ["logger", "helpers", "lru_cache"]
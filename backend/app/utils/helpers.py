@@ -46,6 +46,7 @@ def calculate_portfolio_risk(holdings: list) -> dict:
     """
     import os
     import pandas as pd
+    from ..ml.data_pipeline.price_store import CLOSE, load_arrays
 
     # calculate current value for each holding (use last close price if
     # available)
@@ -56,19 +57,16 @@ def calculate_portfolio_risk(holdings: list) -> dict:
         symbol = h.get('symbol', '').upper()
         qty = h.get('quantity', h.get('shares', 0)) or 0
         current_price = None
-        csv_file = os.path.join(base_path, f"{symbol}.csv")
-        if os.path.exists(csv_file):
-            try:
-                df = pd.read_csv(csv_file)
-                # try to detect a price column
-                price_col = 'Close' if 'Close' in df.columns else df.columns[1]
-                current_price = float(df[price_col].iloc[-1])
-                # compute volatility of daily returns
-                returns = df[price_col].pct_change().dropna()
-                vols.append(returns.std())
-            except Exception:
-                current_price = None
-                vols.append(0)
+        try:
+            data = load_arrays(symbol, base_path)
+        except Exception:
+            data = None
+        if data is not None and data.shape[1] > 0:
+            close = pd.Series(data[CLOSE])
+            current_price = float(close.iloc[-1])
+            # compute volatility of daily returns
+            returns = close.pct_change().dropna()
+            vols.append(returns.std())
         else:
             vols.append(0)
 
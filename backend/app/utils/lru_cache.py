@@ -0,0 +1,82 @@
+"""
+Thread-safe, versioned LRU cache.
+
+Each key holds one ``(version, value)`` entry.  A lookup with a different
+version than the stored one is a miss, so callers that derive the version
+from their inputs (a data file's signature, a model version) never see
+stale values and need no explicit invalidation.  Entries are evicted
+least-recently-used first once their total size exceeds ``max_size``.
+"""
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """LRU of ``key -> (version, value)`` under a size budget.
+
+    ``sizeof(value)`` gives each entry's size (e.g. bytes); by default
+    every entry counts as 1, so ``max_size`` is an entry count.
+    """
+
+    def __init__(self, max_size, sizeof=None):
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, version):
+        """Return the cached value for ``(key, version)`` or ``None``"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, version, value):
+        """Cache ``value``; values larger than the whole budget are not stored"""
+        size = 1 if self.sizeof is None else self.sizeof(value)
+        if size > self.max_size:
+            return
+
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (version, value, size)
+            self._size += size
+
+            while self._size > self.max_size:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key=None):
+        """Drop one key, or every entry when ``key`` is ``None``"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._size = 0
+            else:
+                self._discard(key)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self._size,
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[2]
@@ -0,0 +1,97 @@
+"""
+Benchmark: candlestick chart generation for CNN training data.
+
+Times the previous per-candle ``ax.bar``/``ax.plot`` renderer, the
+collection-based ``generate_candlestick_chart`` and the NumPy rasterizer
+``render_candlestick_array`` on 60-bar windows.
+
+Run from the ``backend`` directory::
+
+    python benchmarks/bench_charts.py
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from app.ml.data_pipeline.generate_charts import (
+    generate_candlestick_chart,
+    render_candlestick_array,
+)
+
+
+WINDOW = 60
+N_MATPLOTLIB = 10
+N_RASTER = 2000
+
+
+def iterrows_candlestick_chart(df, symbol, output_dir):
+    """Previous implementation: one bar and one line artist per candle"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+
+    width = 0.6
+    width2 = 0.05
+
+    for idx, row in df.iterrows():
+        color = 'green' if row['Close'] >= row['Open'] else 'red'
+        ax.bar(idx, row['Close'] - row['Open'], width, bottom=row['Open'], color=color)
+        ax.plot([idx, idx], [row['Low'], row['High']], color=color, linewidth=width2)
+
+    ax.set_xlabel('Date')
+    ax.set_ylabel('Price')
+    ax.set_title(f'{symbol} - Candlestick Chart')
+
+    output_path = os.path.join(output_dir, f"{symbol}_chart.png")
+    plt.savefig(output_path, dpi=100, bbox_inches='tight')
+    plt.close(fig)
+
+    return output_path
+
+
+def make_window(rng, n=WINDOW):
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n)))
+    open_ = close * np.exp(rng.normal(0, 0.005, n))
+    spread = np.abs(rng.normal(0, 0.01, n)) * close
+    return pd.DataFrame({
+        "Open": open_,
+        "High": np.maximum(open_, close) + spread,
+        "Low": np.minimum(open_, close) - spread,
+        "Close": close,
+    })
+
+
+def time_per_call(fn, repeats):
+    fn()  # warm-up
+    t0 = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - t0) / repeats
+
+
+def main():
+    df = make_window(np.random.default_rng(0))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        old = time_per_call(lambda: iterrows_candlestick_chart(df, "BENCH", tmp), N_MATPLOTLIB)
+        collection = time_per_call(lambda: generate_candlestick_chart(df, "BENCH", tmp), N_MATPLOTLIB)
+
+    raster = time_per_call(lambda: render_candlestick_array(df), N_RASTER)
+
+    print(f"{WINDOW}-bar window, per chart")
+    print(f"iterrows + PNG:        {old * 1000:10.2f} ms")
+    print(f"collections + PNG:     {collection * 1000:10.2f} ms  ({old / collection:.1f}x faster)")
+    print(f"raster 128x128 array:  {raster * 1000:10.3f} ms  ({old / raster:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark: downloader wall time as concurrency grows from 1 to N.
+
+Serves a synthetic 100-symbol universe through ``FlakyProvider`` (50 ms
+latency, 10% injected failures) one symbol per request, and reports wall
+time, retries and failed symbols for each worker count.
+
+Run from the ``backend`` directory::
+
+    python benchmarks/bench_downloader.py
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from app.ml.data_pipeline.downloader import ConcurrentDownloader
+from app.ml.data_pipeline.price_providers import CSVFixtureProvider, FlakyProvider
+from bench_price_store import make_synthetic_universe
+
+
+LATENCY = 0.05
+ERROR_RATE = 0.1
+WORKER_COUNTS = [1, 2, 4, 8, 16, 32]
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_dir = Path(tmp)
+        make_synthetic_universe(fixture_dir)
+        symbols = sorted(p.stem for p in fixture_dir.glob("*.csv"))
+
+        start, end = pd.Timestamp("2000-01-01"), pd.Timestamp("2100-01-01")
+        requests = [([symbol], start, end) for symbol in symbols]
+
+        print(f"{len(symbols)} symbols, {LATENCY * 1000:.0f} ms latency, "
+              f"{ERROR_RATE:.0%} injected failures")
+        print(f"{'workers':>8}{'wall (s)':>10}{'calls':>8}{'failed':>8}{'speedup':>9}")
+
+        baseline = None
+        for workers in WORKER_COUNTS:
+            provider = FlakyProvider(
+                CSVFixtureProvider(fixture_dir), latency=LATENCY,
+                error_rate=ERROR_RATE, seed=42,
+            )
+            downloader = ConcurrentDownloader(
+                provider, max_workers=workers, max_retries=3, backoff=0.01,
+            )
+
+            t0 = time.perf_counter()
+            failed = sum(len(errors) for _, _, _, errors in downloader.run(requests))
+            wall = time.perf_counter() - t0
+
+            baseline = baseline or wall
+            print(f"{workers:>8}{wall:>10.2f}{provider.calls:>8}{failed:>8}{baseline / wall:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
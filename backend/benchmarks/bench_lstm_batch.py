@@ -0,0 +1,77 @@
+"""
+Benchmark: per-symbol ``predict_lstm`` loop vs. batched ``predict_lstm_many``.
+
+Scores 100 synthetic symbols with an (untrained) LSTM of the production
+architecture, once with one ``model.predict`` call per symbol and once
+with a single batched forward pass, and checks that both agree.  Requires
+TensorFlow.
+
+Run from the ``backend`` directory::
+
+    python benchmarks/bench_lstm_batch.py
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.ml.model import lstm_predict
+from app.ml.model.lstm_predict import FEATURE_COLS, SEQUENCE_LENGTH, predict_lstm, predict_lstm_many
+from app.ml.training.train_horizons import build_model
+
+
+N_SYMBOLS = 100
+N_BARS = 250
+
+
+def make_frames(rng):
+    frames = {}
+    for i in range(N_SYMBOLS):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, N_BARS)))
+        frames[f"SYM{i:03d}"] = pd.DataFrame({
+            "Open": close * np.exp(rng.normal(0, 0.005, N_BARS)),
+            "High": close * 1.01,
+            "Low": close * 0.99,
+            "Close": close,
+            "Volume": rng.integers(10_000, 1_000_000, N_BARS).astype(float),
+        }, columns=FEATURE_COLS)
+    return frames
+
+
+def main():
+    import tensorflow as tf
+
+    frames = make_frames(np.random.default_rng(0))
+
+    # stand-in model with the production input shape; weights do not matter
+    lstm_predict.tf = tf
+    lstm_predict._model = build_model((SEQUENCE_LENGTH, len(FEATURE_COLS)))
+
+    # warm up both call paths so graph tracing is not timed
+    first = next(iter(frames.values()))
+    predict_lstm(first)
+    predict_lstm_many({"warmup": first})
+
+    t0 = time.perf_counter()
+    loop = {symbol: predict_lstm(df) for symbol, df in frames.items()}
+    loop_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batched = predict_lstm_many(frames)
+    batch_time = time.perf_counter() - t0
+
+    max_err = max(abs(loop[s] - batched[s]) for s in frames)
+
+    print(f"{N_SYMBOLS} symbols, {SEQUENCE_LENGTH}-bar windows")
+    print(f"per-symbol loop:   {loop_time * 1000:10.1f} ms  ({N_SYMBOLS / loop_time:8.0f} symbols/s)")
+    print(f"one batched pass:  {batch_time * 1000:10.1f} ms  ({N_SYMBOLS / batch_time:8.0f} symbols/s)")
+    print(f"speed-up:          {loop_time / batch_time:10.1f}x")
+    print(f"max abs difference: {max_err:.2e}")
+
+
+if __name__ == "__main__":
+    main()
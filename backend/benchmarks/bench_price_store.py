@@ -0,0 +1,109 @@
+"""
+Benchmark: CSV parsing vs. the memory-mapped price store.
+
+Loads every symbol of the NIFTY100 universe through both paths, each in a
+fresh process, and reports wall time and peak RSS.  When ``data/prices`` is
+empty a synthetic 5-year universe is generated in a temporary directory.
+
+Run from the ``backend`` directory::
+
+    python benchmarks/bench_price_store.py
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import multiprocessing as mp
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.ml.data_pipeline import price_store
+
+
+N_SYMBOLS = 100
+N_BARS = 1250
+
+
+def make_synthetic_universe(data_dir, n_symbols=N_SYMBOLS, n_bars=N_BARS):
+    """Write random-walk OHLCV CSVs shaped like the yfinance downloads"""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range(end="2024-12-31", periods=n_bars)
+
+    for i in range(n_symbols):
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, n_bars)))
+        open_ = close * (1 + rng.normal(0, 0.005, n_bars))
+        df = pd.DataFrame({
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": open_,
+            "High": np.maximum(open_, close) * 1.01,
+            "Low": np.minimum(open_, close) * 0.99,
+            "Close": close,
+            "Volume": rng.integers(100_000, 5_000_000, n_bars),
+        })
+        df.to_csv(Path(data_dir) / f"SYM{i:03d}.csv", index=False)
+
+
+def _load_universe(mode, data_dir, symbols, queue):
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    frames = []
+    for symbol in symbols:
+        if mode == "csv":
+            frames.append(price_store.read_price_csv(Path(data_dir) / f"{symbol}.csv"))
+        else:
+            frames.append(price_store.load_prices(symbol, data_dir))
+    elapsed = time.perf_counter() - start
+
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, (rss_after - rss_before) / 1024))
+
+
+def run(mode, data_dir, symbols):
+    """Load the universe in a fresh process; returns (seconds, peak RSS MB)"""
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_load_universe, args=(mode, data_dir, symbols, queue))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def main():
+    data_dir = price_store.PRICES_DIR
+    tmp = None
+
+    if not data_dir.exists() or not any(data_dir.glob("*.csv")):
+        tmp = tempfile.TemporaryDirectory()
+        data_dir = Path(tmp.name) / "prices"
+        data_dir.mkdir()
+        print(f"No price CSVs found; generating {N_SYMBOLS} synthetic symbols...")
+        make_synthetic_universe(data_dir)
+
+    symbols = sorted(p.stem for p in data_dir.glob("*.csv"))
+
+    # one-shot conversion is not part of the timed load
+    for symbol in symbols:
+        price_store.convert_symbol(symbol, data_dir)
+
+    csv_time, csv_rss = run("csv", str(data_dir), symbols)
+    store_time, store_rss = run("store", str(data_dir), symbols)
+
+    print(f"Symbols loaded: {len(symbols)}")
+    print(f"{'path':<8}{'time (ms)':>12}{'RSS (MB)':>12}")
+    print(f"{'csv':<8}{csv_time * 1000:>12.1f}{csv_rss:>12.1f}")
+    print(f"{'store':<8}{store_time * 1000:>12.1f}{store_rss:>12.1f}")
+    print(f"Speedup: {csv_time / store_time:.1f}x")
+
+    if tmp is not None:
+        tmp.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Load test: event-loop responsiveness while predictions are running.
+
+Fires a burst of concurrent ``POST /api/predictions/predict`` requests at
+the real app and, at the same time, probes the health check (``GET /``) and
+the login endpoint (``POST /api/auth/login``).  It runs twice:
+
+* ``inline``   - the old behaviour: the prediction runs on the event loop
+* ``executor`` - predictions go through the bounded prediction executor
+
+and reports probe latencies plus the status codes of the predictions
+(503 = rejected because the executor was saturated).  Probe latency
+counts from when each probe was due, so event-loop stalls show up.
+
+By default each prediction is a stand-in that blocks its thread for
+``--predict-ms``; ``--real`` calls ``predict_stock_async`` on ``--symbol``.
+Concurrent requests for one symbol are coalesced into a single
+computation; ``--distinct`` gives every request its own symbol instead,
+so each one takes an executor slot.
+
+Run from the ``backend`` directory::
+
+    python benchmarks/load_predictions.py --requests 40 --predict-ms 200
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from collections import Counter
+
+# keep the load test's users table out of the real database
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/loadtest.db")
+os.environ.setdefault("MODEL_WARMUP", "0")
+
+import httpx
+import numpy as np
+
+from app.api import prediction_routes
+from app.main import app
+from app.ml.inference.executor import prediction_executor
+from app.ml.inference.predict import predict_stock_async
+from app.ml.inference.single_flight import prediction_flight
+
+
+def fake_prediction(predict_ms):
+    def predict(symbol):
+        time.sleep(predict_ms / 1000)   # blocking work, like file I/O + inference
+        return {
+            "symbol": symbol,
+            "decision": "Hold",
+            "score": 50.0,
+            "technical_score": 50.0,
+            "lstm_probability": 50.0,
+            "latest_price": 100.0,
+            "explanation": [],
+        }
+
+    async def predict_async(symbol, run, timeout=None):
+        return await run(predict, symbol)
+
+    return predict_async
+
+
+async def inline_run(fn, *args, timeout=None):
+    """The old route behaviour: call the sync function on the event loop"""
+    return fn(*args)
+
+
+async def probe(client, method, url, stop, latencies, interval=0.01, **kwargs):
+    """Hit ``url`` every ``interval`` seconds.
+
+    Latency is measured from when the probe was due, so time spent waiting
+    for a blocked event loop counts against it.
+    """
+    while not stop.is_set():
+        due = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        await client.request(method, url, **kwargs)
+        latencies.append((time.perf_counter() - due) * 1000)
+
+
+async def run_phase(n_requests, symbol, distinct):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=60) as client:
+        stop = asyncio.Event()
+        health, login = [], []
+        probes = [
+            asyncio.create_task(probe(client, "GET", "/", stop, health)),
+            asyncio.create_task(probe(client, "POST", "/api/auth/login", stop, login,
+                                      data={"username": "nobody", "password": "wrong"})),
+        ]
+        await asyncio.sleep(0.05)
+
+        t0 = time.perf_counter()
+        responses = await asyncio.gather(*[
+            client.post("/api/predictions/predict",
+                        json={"symbol": f"{symbol}{i}" if distinct else symbol})
+            for i in range(n_requests)
+        ])
+        elapsed = time.perf_counter() - t0
+
+        stop.set()
+        await asyncio.gather(*probes)
+
+    return elapsed, Counter(r.status_code for r in responses), health, login
+
+
+def summarize(name, latencies):
+    if not latencies:
+        return f"{name:>7}: no probes completed"
+    lat = np.asarray(latencies)
+    return (f"{name:>7}: n={len(lat):4d}  p50={np.percentile(lat, 50):8.1f} ms  "
+            f"p99={np.percentile(lat, 99):8.1f} ms  max={lat.max():8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prediction load test")
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--predict-ms", type=float, default=200)
+    parser.add_argument("--real", action="store_true", help="call the real predict_stock_async")
+    parser.add_argument("--symbol", default="INFY")
+    parser.add_argument("--distinct", action="store_true",
+                        help="one symbol per request, so nothing is coalesced")
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    prediction_routes.predict_stock_async = (
+        predict_stock_async if args.real else fake_prediction(args.predict_ms)
+    )
+
+    executor_run = prediction_executor.run
+    for mode in ("inline", "executor"):
+        prediction_executor.run = inline_run if mode == "inline" else executor_run
+
+        elapsed, codes, health, login = asyncio.run(run_phase(args.requests, args.symbol, args.distinct))
+
+        print(f"\n[{mode}] {args.requests} predictions in {elapsed:.2f} s, status codes {dict(codes)}")
+        print(summarize("health", health))
+        print(summarize("login", login))
+
+    print("\nexecutor:", prediction_executor.stats())
+    print("single flight:", prediction_flight.stats())
+    prediction_executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""The NumPy LSTM forward pass must reproduce Keras outputs."""
+import numpy as np
+import pytest
+
+from app.ml.model.numpy_lstm import NumpyLSTMModel, export_weights
+
+tf = pytest.importorskip("tensorflow")
+
+
+def build_model(recurrent_activation):
+    from tensorflow.keras.layers import LSTM, Dense, Dropout, Input
+    from tensorflow.keras.models import Sequential
+
+    tf.keras.utils.set_random_seed(7)
+    return Sequential([
+        Input(shape=(60, 5)),
+        LSTM(32, return_sequences=True, recurrent_activation=recurrent_activation),
+        Dropout(0.2),
+        LSTM(16, recurrent_activation=recurrent_activation),
+        Dropout(0.2),
+        Dense(8, activation="relu"),
+        Dense(1, activation="sigmoid"),
+    ])
+
+
+@pytest.mark.parametrize("recurrent_activation", ["sigmoid", "hard_sigmoid"])
+def test_matches_keras(tmp_path, recurrent_activation):
+    model = build_model(recurrent_activation)
+
+    # random (non-zero) biases so gate order mistakes change the output
+    for layer in model.layers:
+        weights = layer.get_weights()
+        if weights:
+            rng = np.random.default_rng(0)
+            layer.set_weights([w + rng.normal(0, 0.1, w.shape).astype(w.dtype) for w in weights])
+
+    x = np.random.default_rng(1).normal(size=(17, 60, 5)).astype(np.float32)
+    expected = model.predict(x, verbose=0)
+
+    path = export_weights(model, tmp_path / "lstm.npz")
+    got = NumpyLSTMModel.load(path).predict(x)
+
+    assert got.shape == expected.shape
+    np.testing.assert_allclose(got, expected, rtol=1e-4, atol=1e-5)
@@ -0,0 +1,105 @@
+"""Candlestick pattern detection and scoring."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml.data_pipeline.feature_engineering import build_features
+from app.ml.indicators.patterns import PATTERNS, detect_patterns
+from app.ml.inference.hybrid_decision import make_hybrid_decision
+from app.ml.scoring_engine.codes import explain_many
+from app.ml.scoring_engine.pattern_score import (
+    MAX_PATTERN_SCORE,
+    PATTERN_RULES,
+    pattern_score,
+    pattern_scores,
+)
+
+
+# (Open, High, Low, Close) per candle; the pattern completes on the last one
+CANDLES = {
+    "hammer": [(10.2, 10.3, 9.9, 10.0), (10.8, 11.1, 9.5, 11.0)],
+    "shooting_star": [(9.8, 10.1, 9.7, 10.0), (9.2, 10.6, 8.9, 9.0)],
+    "bullish_engulfing": [(10.5, 10.6, 9.9, 10.0), (9.9, 11.1, 9.8, 11.0)],
+    "bearish_engulfing": [(10.0, 10.6, 9.9, 10.5), (10.6, 10.7, 9.4, 9.5)],
+    "doji": [(10.0, 10.2, 9.8, 10.1), (10.0, 10.5, 9.5, 10.01)],
+    "morning_star": [(12.0, 12.1, 9.9, 10.0), (9.8, 10.2, 9.5, 9.85), (10.0, 11.6, 9.9, 11.5)],
+    "evening_star": [(10.0, 12.1, 9.9, 12.0), (12.2, 12.5, 11.8, 12.15), (12.0, 12.1, 10.4, 10.5)],
+    "three_white_soldiers": [(10.0, 11.1, 9.9, 11.0), (11.0, 12.1, 10.9, 12.0),
+                             (12.0, 13.1, 11.9, 13.0)],
+    "three_black_crows": [(13.0, 13.1, 11.9, 12.0), (12.0, 12.1, 10.9, 11.0),
+                          (11.0, 11.1, 9.9, 10.0)],
+}
+
+
+def candles(rows, index=None):
+    return pd.DataFrame(rows, columns=["Open", "High", "Low", "Close"], index=index)
+
+
+def random_bars(rng, n_bars):
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_bars)))
+    open_ = np.r_[close[0], close[:-1]] * (1 + rng.normal(0, 0.01, n_bars))
+    high = np.maximum(open_, close) * (1 + rng.exponential(0.01, n_bars))
+    low = np.minimum(open_, close) * (1 - rng.exponential(0.01, n_bars))
+    flat = rng.random(n_bars) < 0.05  # doji-like bars
+    open_[flat] = close[flat]
+    return pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close,
+                         "Volume": rng.uniform(1e5, 1e6, n_bars)})
+
+
+@pytest.mark.parametrize("name", PATTERNS)
+def test_pattern_detected(name):
+    # a neutral leading candle, so every pattern has full history
+    df = candles([(10.0, 10.4, 9.6, 10.2)] + CANDLES[name])
+
+    flags = detect_patterns(df)
+
+    assert flags[name][-1]
+    assert not any(flags[other][0] for other in PATTERNS)
+
+    score, explanation = pattern_score(df)
+    assert PATTERN_RULES[name][1] in explanation
+    assert abs(score) <= MAX_PATTERN_SCORE
+
+
+def test_score_is_clipped():
+    # the morning star's last candle also engulfs the small middle one: 15 + 15
+    df = candles(CANDLES["morning_star"])
+
+    score, explanation = pattern_score(df)
+
+    assert explanation == ["Bullish engulfing pattern", "Morning star (bullish reversal)"]
+    assert score == MAX_PATTERN_SCORE
+
+
+@pytest.mark.parametrize("index", [None, pd.bdate_range("2024-01-01", periods=3)])
+def test_pattern_score_on_three_bars(index):
+    # used to raise KeyError on any frame of three or more bars
+    df = candles(CANDLES["three_white_soldiers"], index=index)
+
+    score, explanation = pattern_score(df)
+
+    assert (score, explanation) == (20, ["Three white soldiers (strong uptrend)"])
+
+
+def test_pattern_score_short_history():
+    assert pattern_score(candles(CANDLES["hammer"])) == (
+        0, ["Insufficient data for pattern analysis"])
+
+
+def test_last_bar_matches_full_history():
+    df = random_bars(np.random.default_rng(11), 400)
+
+    scores, codes = pattern_scores(df)
+    explanations = explain_many(codes)
+
+    for t in range(3, len(df) + 1):
+        assert pattern_score(df.iloc[:t]) == (scores[t - 1], explanations[t - 1])
+
+
+def test_make_hybrid_decision():
+    df = build_features(random_bars(np.random.default_rng(5), 120))
+
+    result = make_hybrid_decision(df, df.iloc[-1], lstm_prob=0.6)
+
+    assert result["decision"] in ("Strong Buy", "Buy", "Hold", "Avoid")
+    assert 0 <= result["final_score"] <= 100
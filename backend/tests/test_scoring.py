@@ -0,0 +1,86 @@
+"""Vectorized scorers must agree with the scalar ones on every row."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml.data_pipeline.feature_engineering import build_features
+from app.ml.scoring_engine.codes import explain_many
+from app.ml.scoring_engine.final_score import (
+    calculate_final_score,
+    calculate_final_scores,
+    score_frame,
+)
+from app.ml.scoring_engine.risk_score import risk_score
+from app.ml.scoring_engine.sentiment_score import sentiment_score, sentiment_scores
+from app.ml.scoring_engine.technical_score import technical_score
+from app.ml.scoring_engine.trend_score import trend_score
+
+
+N_BARS = 500
+
+# every column a scoring rule reads
+SCORED_COLUMNS = ["rsi", "ema_diff", "macd", "trend_slope", "momentum_20", "atr", "Close",
+                  "volume_ma_ratio", "volatility"]
+
+
+def make_features(rng, optional):
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, N_BARS)))
+    spread = close * rng.uniform(0.002, 0.05, N_BARS)
+    df = build_features(pd.DataFrame({
+        "Date": pd.bdate_range("2020-01-01", periods=N_BARS),
+        "Open": close * (1 + rng.normal(0, 0.005, N_BARS)),
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+        "Volume": rng.uniform(1e5, 1e6, N_BARS),
+    })).reset_index(drop=True)
+
+    # make sure the RSI extremes are exercised, not just whatever the walk hits
+    df.loc[::17, "rsi"] = 15.0
+    df.loc[5::17, "rsi"] = 85.0
+
+    if optional:
+        df["volume_ma_ratio"] = rng.uniform(0.5, 1.6, len(df))
+        df["volatility"] = rng.uniform(0.005, 0.06, len(df))
+
+    # NaN in each scored column on a few rows of its own, and all at once on one row
+    for i, col in enumerate(SCORED_COLUMNS):
+        if col in df:
+            df.loc[3 + i::41, col] = np.nan
+    df.loc[len(df) // 2, [col for col in SCORED_COLUMNS if col in df]] = np.nan
+
+    return df
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["required", "optional"])
+def features(request):
+    return make_features(np.random.default_rng(7), request.param)
+
+
+def test_score_frame_matches_scalar(features):
+    scored = score_frame(features)
+    explanations = explain_many(scored["code"])
+
+    for i, (_, row) in enumerate(features.iterrows()):
+        final, decision, explanation = calculate_final_score(row)
+        got = scored.iloc[i]
+
+        assert got["technical_score"] == technical_score(row)[0]
+        assert got["trend_score"] == trend_score(row)[0]
+        assert got["risk_score"] == risk_score(row)[0]
+        assert got["sentiment_score"] == sentiment_score(row)[0]
+        assert (got["final_score"], got["decision"], explanations[i]) == (final, decision, explanation)
+
+
+def test_calculate_final_scores_matches_scalar(features):
+    final, decision, explanation = calculate_final_scores(features)
+
+    expected = [calculate_final_score(row) for _, row in features.iterrows()]
+    assert list(zip(final, decision, explanation)) == expected
+
+
+def test_sentiment_scores_match_scalar(features):
+    scores, codes = sentiment_scores(features)
+
+    expected = [sentiment_score(row) for _, row in features.iterrows()]
+    assert list(zip(scores, explain_many(codes))) == expected
@@ -0,0 +1,99 @@
+"""Streaming indicators must reproduce the batch versions bar for bar."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml.indicators.indicators import (
+    compute_atr,
+    compute_bollinger_bands,
+    compute_ema,
+    compute_macd,
+    compute_rsi,
+    compute_stochastic,
+)
+from app.ml.indicators.streaming import (
+    StreamingATR,
+    StreamingBollingerBands,
+    StreamingEMA,
+    StreamingMACD,
+    StreamingRSI,
+    StreamingStochastic,
+)
+
+
+N_BARS = 600
+SPLIT = 257  # snapshot/restore mid-stream, away from any window boundary
+
+
+@pytest.fixture(scope="module")
+def bars():
+    rng = np.random.default_rng(42)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, N_BARS)))
+    # a flat stretch longer than the stochastic window: %K is NaN there
+    close[300:320] = close[299]
+    spread = close * rng.uniform(0.002, 0.02, N_BARS)
+    spread[300:320] = 0
+    return pd.DataFrame({
+        "High": close + spread,
+        "Low": close - spread,
+        "Close": close,
+    })
+
+
+def run_stream(indicator, rows):
+    """Feed every row, snapshotting and restoring the indicator at SPLIT"""
+    out = []
+    for i, row in enumerate(rows):
+        if i == SPLIT:
+            indicator = type(indicator).restore(indicator.snapshot())
+        out.append(indicator.update(*row))
+    return np.array(out, dtype=float)
+
+
+def assert_matches(streamed, batch):
+    batch = np.asarray(batch, dtype=float)
+    np.testing.assert_array_equal(np.isnan(streamed), np.isnan(batch))
+    np.testing.assert_allclose(streamed, batch, rtol=1e-9, atol=1e-8, equal_nan=True)
+
+
+def close_rows(bars):
+    return [(c,) for c in bars["Close"]]
+
+
+def hlc_rows(bars):
+    return list(bars[["High", "Low", "Close"]].itertuples(index=False, name=None))
+
+
+def test_ema(bars):
+    assert_matches(run_stream(StreamingEMA(20), close_rows(bars)), compute_ema(bars["Close"], 20))
+
+
+def test_macd(bars):
+    assert_matches(run_stream(StreamingMACD(), close_rows(bars)), compute_macd(bars["Close"]))
+
+
+def test_rsi(bars):
+    assert_matches(run_stream(StreamingRSI(14), close_rows(bars)), compute_rsi(bars["Close"], 14))
+
+
+def test_atr(bars):
+    assert_matches(run_stream(StreamingATR(14), hlc_rows(bars)), compute_atr(bars, 14))
+
+
+def test_bollinger_bands(bars):
+    streamed = run_stream(StreamingBollingerBands(20, 2), close_rows(bars))
+    for column, batch in zip(streamed.T, compute_bollinger_bands(bars["Close"], 20, 2)):
+        assert_matches(column, batch)
+
+
+def test_stochastic(bars):
+    streamed = run_stream(StreamingStochastic(14), hlc_rows(bars))
+    k, d = compute_stochastic(bars, 14)
+    assert np.isnan(k.values[313:320]).all()
+    assert_matches(streamed[:, 0], k)
+    assert_matches(streamed[:, 1], d)
+
+
+def test_restore_rejects_other_indicator():
+    with pytest.raises(ValueError):
+        StreamingRSI.restore(StreamingEMA(10).snapshot())
@@ -0,0 +1,82 @@
+"""Closed-form rolling slopes must match a per-window ``np.polyfit``."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml.indicators.indicators import compute_trend_slope, compute_trend_slopes, rolling_slopes
+
+
+N_BARS = 300
+
+
+def polyfit_slope(series, window):
+    """Reference: one least-squares fit per complete, NaN-free window"""
+    return series.rolling(window).apply(lambda x: np.polyfit(range(len(x)), x, 1)[0], raw=True)
+
+
+def assert_same(got, expected):
+    got, expected = np.asarray(got, dtype=float), np.asarray(expected, dtype=float)
+    np.testing.assert_array_equal(np.isnan(got), np.isnan(expected))
+    np.testing.assert_allclose(got, expected, rtol=1e-8, atol=1e-10, equal_nan=True)
+
+
+@pytest.fixture(scope="module")
+def close():
+    rng = np.random.default_rng(3)
+    return pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.015, N_BARS))), name="Close")
+
+
+@pytest.fixture(scope="module")
+def gappy(close):
+    values = close.copy()
+    values[[40, 41, 150, 299]] = np.nan
+    return values
+
+
+def test_single_window(close):
+    slope = compute_trend_slope(close, 10)
+
+    assert slope.index.equals(close.index)
+    assert slope.isna().sum() == 9  # incomplete leading windows
+    assert_same(slope, polyfit_slope(close, 10))
+
+
+def test_multiple_windows(close):
+    slopes = compute_trend_slopes(close, (10, 20, 50))
+
+    assert list(slopes.columns) == ["trend_slope_10", "trend_slope_20", "trend_slope_50"]
+    for w in (10, 20, 50):
+        assert_same(slopes[f"trend_slope_{w}"], polyfit_slope(close, w))
+
+
+def test_windows_with_nan(gappy):
+    for w in (2, 10, 20):
+        assert_same(compute_trend_slope(gappy, w), polyfit_slope(gappy, w))
+
+
+def test_leading_nan_and_short_history(close):
+    padded = pd.concat([pd.Series([np.nan] * 25), close.iloc[:40]], ignore_index=True)
+    assert_same(compute_trend_slope(padded, 10), polyfit_slope(padded, 10))
+
+    # a window longer than the history is never complete
+    assert compute_trend_slope(close.iloc[:5], 10).isna().all()
+
+
+def test_panel_matches_each_column(close, gappy):
+    panel = np.column_stack([close, gappy, close.iloc[::-1].values, np.full(N_BARS, np.nan)])
+
+    slopes = rolling_slopes(panel, [10, 20])
+
+    for w in (10, 20):
+        assert slopes[w].shape == panel.shape
+        for j in range(panel.shape[1]):
+            assert_same(slopes[w][:, j], polyfit_slope(pd.Series(panel[:, j]), w))
+
+
+def test_all_nan():
+    values = np.full((50, 3), np.nan)
+
+    slopes = rolling_slopes(values, [10])
+
+    assert slopes[10].shape == values.shape
+    assert np.isnan(slopes[10]).all()
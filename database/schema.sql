@@ -34,8 +34,8 @@ CREATE TABLE IF NOT EXISTS predictions (
     lstm_score FLOAT,
     confidence FLOAT,
     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    INDEX idx_symbol (symbol),
-    INDEX idx_timestamp (timestamp)
+    -- history is read per symbol, newest first: ORDER BY timestamp DESC, id DESC
+    INDEX idx_symbol_timestamp (symbol, timestamp, id)
 );
 
 -- Watchlist table